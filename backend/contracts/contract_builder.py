@@ -13,11 +13,12 @@ Rules (Batch 4)
   differences.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from difflib import get_close_matches
 from pathlib import Path
 from typing import Dict, Iterable, Optional
 import json
+import os
 
 from backend.nwu_formats.ta_parser import PerformanceContract as TAPerformanceContract
 from backend.contracts.kpi_generator import generate_kpis_from_outputs
@@ -42,7 +43,12 @@ class MergedKPA:
     review_reason: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow: the contract is serialised straight after, so asdict()'s
+        # deep copy of outputs/kpis/context buys nothing.
+        return {name: getattr(self, name) for name in _MERGED_KPA_FIELDS}
+
+
+_MERGED_KPA_FIELDS = tuple(f.name for f in fields(MergedKPA))
 
 
 @dataclass
@@ -270,5 +276,13 @@ def save_final_contract(contract: PerformanceContract) -> Path:
     safe_year = str(contract.cycle_year) or "unknown_year"
     out_path = base_dir / f"{safe_staff}_{safe_year}_FINAL.json"
 
-    out_path.write_text(json.dumps(contract.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+    # Renamed into place so a failed dump never truncates the last good contract
+    tmp_path = out_path.with_name(f"{out_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump(contract.to_dict(), fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return out_path
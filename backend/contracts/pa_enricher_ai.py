@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Sequence
 from openpyxl import load_workbook
 
 from backend.contracts.pa_generator import DEFAULT_KPA_NAMES, PA_ORDER
-from backend.llm.ollama_client import extract_json_object, query_ollama
+from backend.llm.ollama_client import LLMJsonError, extract_json_object, query_ollama
 from backend.staff_profile import StaffProfile
 
 
@@ -141,8 +141,9 @@ Rules:
 def get_ai_json(profile: StaffProfile, skeleton_rows: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
     prompt = _build_prompt(profile, skeleton_rows)
     raw = query_ollama(prompt, format="json")
-    plan = extract_json_object(raw)
-    if plan == "AI_FAILED":
+    try:
+        plan = extract_json_object(raw)
+    except LLMJsonError:
         return {}
     return _plan_to_mapping(plan)
 
@@ -8,6 +8,7 @@ Public API
 scorer = NWUScorer(<path_to>/nwu_brain/brain_manifest.json)
 
 scored   = scorer.compute(item_dict)     # → canonical scored dict
+batch    = scorer.compute_batch(items)   # → list of scored dicts, input order
 csv_row  = scorer.to_csv_row(scored)     # → flat CSV v2 row (for exports)
 modeljs  = scorer.to_model_json(scored)  # → compact structure for assistant prompts
 
@@ -29,10 +30,16 @@ from __future__ import annotations
 import json
 import math
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+try:
+    import ahocorasick  # optional: single-pass tier keyword scan in compute_batch
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 
 # -----------------------
 # Low-level file utilities
@@ -61,6 +68,49 @@ def _compile_pat(pat: str, flags: int = _JSON_RE_FLAGS) -> re.Pattern:
         return re.compile(re.escape(pat), flags)
 
 
+# Any regex syntax at all; patterns without it are plain keywords
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def _split_literals(pats: List[re.Pattern]) -> Tuple[Tuple[str, ...], List[re.Pattern]]:
+    """
+    Separate plain ASCII keywords (returned lower-cased) from real regexes.
+    Against ASCII text an IGNORECASE search for such a keyword is exactly a
+    substring test on the lower-cased text, which is far cheaper than sre's
+    case-insensitive scan.
+    """
+    literals: List[str] = []
+    regexes: List[re.Pattern] = []
+    for p in pats:
+        src = p.pattern
+        # NUL is the item separator in NWUScorer._derive_tiers' batch corpus
+        if src and src.isascii() and "\0" not in src and not _REGEX_META_RE.search(src):
+            literals.append(src.lower())
+        else:
+            regexes.append(p)
+    return tuple(literals), regexes
+
+
+def _build_tier_automaton(tier_literals: List[Tuple[str, Tuple[str, ...], List[re.Pattern]]]):
+    """
+    One automaton over every tier's plain keywords, each mapped to the index
+    of the first tier that lists it. None without pyahocorasick.
+    """
+    if ahocorasick is None:
+        return None
+    first_tier: Dict[str, int] = {}
+    for t, (_, literals, _) in enumerate(tier_literals):
+        for lit in literals:
+            first_tier.setdefault(lit, t)
+    if not first_tier:
+        return None
+    automaton = ahocorasick.Automaton()
+    for lit, t in first_tier.items():
+        automaton.add_word(lit, t)
+    automaton.make_automaton()
+    return automaton
+
+
 # -----------------------
 # Data carriers
 # -----------------------
@@ -132,6 +182,8 @@ class NWUScorer:
 
         # Prepare tier regex lists (TOLERANT to dict|list|string)
         self._compiled_tiers: List[Tuple[str, List[re.Pattern]]] = self._prepare_tiers(self.tier_keywords_raw)
+        self._tier_literals = [(name, *_split_literals(pats)) for name, pats in self._compiled_tiers]
+        self._tier_automaton = _build_tier_automaton(self._tier_literals)
 
         # Build band thresholds (defaults if not present)
         self.bands: List[BandRule] = self._load_bands(self.institution_profile)
@@ -152,10 +204,30 @@ class NWUScorer:
             item = kwargs
         if not isinstance(item, dict):
             raise TypeError("NWUScorer.compute() expects a dict or kwargs")
+        return self._score(item)
 
-        title     = _coerce_str(item.get("title") or item.get("name") or item.get("path") or "")
+    def compute_batch(self, items: Iterable[dict]) -> List[dict]:
+        """
+        Score several items in one call; results are in input order.
+        With pyahocorasick installed, tier keywords are matched in one pass
+        over the whole batch (see _derive_tiers) instead of once per item.
+        Raises on the first item that cannot be scored, so callers that need
+        per-item error isolation should fall back to compute().
+        """
+        items = list(items)
+        for item in items:
+            if not isinstance(item, dict):
+                raise TypeError("NWUScorer.compute_batch() expects dicts")
+        tiers = self._derive_tiers([_title_and_text(item) for item in items])
+        return [self._score(item, tier) for item, tier in zip(items, tiers)]
+
+    def _score(self, item: dict, tier: Optional[Tuple[str, str]] = None) -> dict:
+        """
+        Score one item. ``tier`` is the (tier_name, rule_name) pair when the
+        caller has already derived it for a batch.
+        """
+        title, full_text = _title_and_text(item)
         platform  = _coerce_str(item.get("platform") or item.get("source") or "")
-        full_text = _coerce_str(item.get("full_text") or "")
         relpath   = _coerce_str(item.get("relpath") or "")
         modified  = _coerce_str(item.get("modified") or item.get("date") or "")
         size      = item.get("size")
@@ -165,7 +237,7 @@ class NWUScorer:
         kpa_list = self._route_kpa(title=title, platform=platform, path=item.get("path") or "", text=full_text)
 
         # 2) Tier detection (first-match precedence)
-        tier_name, tier_rule = self._derive_tier(full_text, title)
+        tier_name, tier_rule = tier if tier is not None else self._derive_tier(full_text, title)
 
         # 3) Values index signal
         values_score, values_hits = self._score_values(full_text)
@@ -399,12 +471,63 @@ class NWUScorer:
         Returns (tier_name, rule_name)
         """
         hay = f"{title}\n{text}" if text else title
-        for tier_name, pats in self._compiled_tiers:
-            for p in pats:
-                if p.search(hay):
-                    return tier_name, tier_name
+        if not hay.isascii():
+            for tier_name, pats in self._compiled_tiers:
+                for p in pats:
+                    if p.search(hay):
+                        return tier_name, tier_name
+            return "", ""
+
+        low = hay.lower()
+        for tier_name, literals, regexes in self._tier_literals:
+            if any(lit in low for lit in literals) or any(p.search(hay) for p in regexes):
+                return tier_name, tier_name
         return "", ""
 
+    def _derive_tiers(self, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        _derive_tier for a batch of (title, text) pairs.
+        With pyahocorasick, ASCII haystacks are lower-cased into one
+        NUL-separated corpus and a single automaton pass finds each item's
+        first tier with a plain keyword in it; the few real regexes then run
+        per item, only for tiers ahead of that one. Everything else takes the
+        per-item path.
+        """
+        if self._tier_automaton is None:
+            return [self._derive_tier(text, title) for title, text in pairs]
+
+        results = [("", "")] * len(pairs)
+        hays: List[str] = []
+        owners: List[int] = []
+        for i, (title, text) in enumerate(pairs):
+            hay = f"{title}\n{text}" if text else title
+            if hay.isascii():
+                hays.append(hay)
+                owners.append(i)
+            else:
+                results[i] = self._derive_tier(text, title)
+        if not hays:
+            return results
+
+        starts: List[int] = []
+        pos = 0
+        for hay in hays:
+            starts.append(pos)
+            pos += len(hay) + 1
+        n_tiers = len(self._tier_literals)
+        first = [n_tiers] * len(hays)
+        for end, t in self._tier_automaton.iter("\0".join(hay.lower() for hay in hays)):
+            k = bisect_right(starts, end) - 1
+            if t < first[k]:
+                first[k] = t
+
+        for k, hay in enumerate(hays):
+            for t, (tier_name, _, regexes) in enumerate(self._tier_literals):
+                if t == first[k] or any(p.search(hay) for p in regexes):
+                    results[owners[k]] = (tier_name, tier_name)
+                    break
+        return results
+
     # --- KPA routing ---
     def _route_kpa(self, title: str, platform: str, path: str, text: str) -> List[int]:
         """
@@ -559,6 +682,11 @@ def _coerce_str(x: Any) -> str:
     return str(x)
 
 
+def _title_and_text(item: dict) -> Tuple[str, str]:
+    title = _coerce_str(item.get("title") or item.get("name") or item.get("path") or "")
+    return title, _coerce_str(item.get("full_text") or "")
+
+
 def _ext_of(name: str | Any) -> str:
     try:
         s = (name or "").lower()
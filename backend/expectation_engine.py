@@ -1,3 +1,4 @@
+import contextlib
 import json
 import math
 import os
@@ -12,6 +13,14 @@ EXPECT_DIR = os.path.join("backend", "data", "staff_expectations")
 os.makedirs(EXPECT_DIR, exist_ok=True)
 
 MODULE_CODE_RE = re.compile(r"[A-Z]{2,6}\s?\d{3,4}[A-Z]{0,3}")
+MONTH_SPLIT_RE = re.compile(r"[^A-Za-z/]+")
+SECTION_NUMBER_RE = re.compile(r"section\s*(\d+)")
+# Mentee names ("Jane Doe") and supervised students ("Doe, J." / "Doe JK")
+MENTEE_NAME_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?:\s+([A-Z][a-z]+))?")
+STUDENT_NAME_RE = re.compile(r"\b([A-Z][a-z]+),?\s+([A-Z]\.?\s*[A-Z]*\.?)")
+MODULE_LEVEL_RE = re.compile(r"[A-Z]+\s*(\d{3})")
+COMMITTEE_HOURS_RE = re.compile(r":\s*(\d+)\s*hours?", re.IGNORECASE)
+TRAILING_NUMBER_RE = re.compile(r"\s(\d+)$")
 MONTH_TOKENS = {
     "jan",
     "january",
@@ -121,7 +130,7 @@ def _extract_month_tokens(text: str) -> List[str]:
 
     tokens: List[str] = []
     lowered = text.lower()
-    for part in re.split(r"[^A-Za-z/]+", lowered):
+    for part in MONTH_SPLIT_RE.split(lowered):
         if not part:
             continue
         for candidate in part.split("/"):
@@ -244,7 +253,11 @@ BLACKLIST_PHRASES = [
 # Core TA parser
 # ----------------------------
 
-def parse_task_agreement(excel_path: str, director_level: bool = False) -> Dict[str, Any]:
+def parse_task_agreement(
+    excel_path: str,
+    director_level: bool = False,
+    workbook: zipfile.ZipFile | None = None,
+) -> Dict[str, Any]:
     """
     Parse the NWU FEDU Task Agreement form into a structured expectations summary.
 
@@ -258,14 +271,16 @@ def parse_task_agreement(excel_path: str, director_level: bool = False) -> Dict[
       - Social / OHS expectations
 
     This implementation is tailored for the 'Task Agreement Form' sheet layout.
+    ``workbook`` may be the caller's already-open archive of ``excel_path``; it
+    is read from but left open.
     """
 
     path = Path(excel_path)
-    if not path.exists():
+    if workbook is None and not path.exists():
         raise FileNotFoundError(excel_path)
 
     try:
-        with zipfile.ZipFile(path) as zf:
+        with (contextlib.nullcontext(workbook) if workbook is not None else zipfile.ZipFile(path)) as zf:
             shared = _load_shared_strings(zf)
             sheets = _workbook_sheets(zf)
             if not sheets:
@@ -345,7 +360,7 @@ def parse_task_agreement(excel_path: str, director_level: bool = False) -> Dict[
 
         # --- Section detection (e.g., "SECTION 1 ... KPA: ...") ---
         if "section" in row_text_lower and "kpa" in row_text_lower:
-            m = re.search(r"section\s*(\d+)", row_text_lower)
+            m = SECTION_NUMBER_RE.search(row_text_lower)
             if m:
                 try:
                     current_section = int(m.group(1))
@@ -476,8 +491,7 @@ def parse_task_agreement(excel_path: str, director_level: bool = False) -> Dict[
         elif current_block == "mentorship":
             # Section 4.1: Research mentees (NOT postgrad supervision students)
             # Extract mentee names
-            name_pattern = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?:\s+([A-Z][a-z]+))?')
-            match = name_pattern.search(detail)
+            match = MENTEE_NAME_RE.search(detail)
             if match and not MODULE_CODE_RE.search(detail):
                 full_name = match.group(0).strip()
                 mentorship.append({"name": full_name, "hours": hours_val})
@@ -500,8 +514,7 @@ def parse_task_agreement(excel_path: str, director_level: bool = False) -> Dict[
                 consumed = True
             else:
                 # Extract names using pattern: Surname, Initials
-                name_pattern = re.compile(r'\b([A-Z][a-z]+),?\s+([A-Z]\.?\s*[A-Z]*\.?)')
-                names = name_pattern.findall(detail)
+                names = STUDENT_NAME_RE.findall(detail)
                 if names:
                     for surname, initials in names:
                         student_name = f"{surname}, {initials.strip()}"
@@ -804,8 +817,7 @@ def build_expectations_from_ta(staff_id: str, year: int, ta_summary: Dict[str, A
                  HISE 322 = 3rd year, 2nd semester, sequence 2
         """
         # Extract the 3-digit number from module code
-        import re
-        match = re.search(r'[A-Z]+\s*(\d{3})', str(module_code))
+        match = MODULE_LEVEL_RE.search(str(module_code))
         if match:
             three_digits = match.group(1)
             # Middle digit (index 1) indicates semester
@@ -1570,13 +1582,12 @@ def build_expectations_from_ta(staff_id: str, year: int, ta_summary: Dict[str, A
     # Helper function to extract hours from committee description
     def _extract_committee_hours(committee_desc: str) -> float:
         """Extract hours from strings like 'Faculty Board: 12 hours' or 'SDL scientific committee 5'"""
-        import re
         # Look for patterns like ": 12 hours" or "12 hours per"
-        match = re.search(r':\s*(\d+)\s*hours?', committee_desc, re.IGNORECASE)
+        match = COMMITTEE_HOURS_RE.search(committee_desc)
         if match:
             return float(match.group(1))
         # Look for standalone numbers (e.g., "SDL scientific committee 5")
-        match = re.search(r'\s(\d+)$', committee_desc)
+        match = TRAILING_NUMBER_RE.search(committee_desc)
         if match:
             return float(match.group(1))
         return 0.0
@@ -1887,5 +1898,6 @@ if __name__ == "__main__":
 
     summary = parse_task_agreement(args.excel_path)
     out_path = Path(EXPECT_DIR) / f"{Path(args.excel_path).stem}_summary.json"
-    out_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2, ensure_ascii=False)
     print(f"Saved summary to {out_path}")
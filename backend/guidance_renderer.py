@@ -4,6 +4,45 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 import re
 
+try:
+    import ahocorasick  # optional: single-pass keyword matching
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+_COMMUNITY_WORDS = ('school', 'community', 'outreach', 'ngo', 'stakeholder', 'municipal', 'volunteer')
+_OUTSIDE_WORDS = ('outside', 'ngo', 'community', 'school', 'stakeholder', 'municipal')
+_KEYWORD_SETS = {'opener': _COMMUNITY_WORDS, 'perm': _OUTSIDE_WORDS}
+
+
+def _build_keyword_automaton():
+    if ahocorasick is None:
+        return None
+    tags_by_word: Dict[str, set] = {}
+    for tag, words in _KEYWORD_SETS.items():
+        for word in words:
+            tags_by_word.setdefault(word, set()).add(tag)
+    automaton = ahocorasick.Automaton()
+    for word, tags in tags_by_word.items():
+        automaton.add_word(word, (word, frozenset(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KW_AUTOMATON = _build_keyword_automaton()
+
+
+def _keyword_tags(corpus: str) -> set:
+    """Return the names of the keyword sets in ``_KEYWORD_SETS`` that occur in ``corpus``."""
+    if _KW_AUTOMATON is not None:
+        tags: set = set()
+        for _, (_, word_tags) in _KW_AUTOMATON.iter(corpus):
+            tags |= word_tags
+            if len(tags) == len(_KEYWORD_SETS):
+                break
+        return tags
+    return {tag for tag, words in _KEYWORD_SETS.items() if any(word in corpus for word in words)}
+
 
 class SafeDict(dict):
     def __missing__(self, key):
@@ -183,10 +222,15 @@ def generate_qualitative_guidance(ctx: Dict[str, Any], variant: str = 'detailed'
 
         title_clean = clean(title)
 
+        # The opener and permission heuristics only look at the task itself;
+        # the wider corpus (with KPA and preferred examples) feeds value tagging.
+        lc = (title + ' ' + ' '.join(examples or []) + ' ' + ' '.join(labels or [])).lower()
+        corpus = ' '.join([title or '', kpa or '', ' '.join(examples or []), ' '.join(labels or []), ' '.join(preferred_examples or [])]).lower()
+        keyword_tags = _keyword_tags(lc)
+
         # Friendly opener when community or outreach is involved
         opener = ''
-        lc = (title + ' ' + ' '.join(examples or []) + ' ' + ' '.join(labels or [])).lower()
-        if any(word in lc for word in ['school', 'community', 'outreach', 'ngo', 'stakeholder', 'municipal', 'volunteer']):
+        if 'opener' in keyword_tags:
             # vary opener usage to avoid repetition — include only some of the time
             if random.random() < 0.35:
                 openers = ["Wow impressive", "Nice work", "Great initiative", "Good to see this", "Well done"]
@@ -230,7 +274,7 @@ def generate_qualitative_guidance(ctx: Dict[str, Any], variant: str = 'detailed'
 
         # Permission note for external stakeholders
         perm = ''
-        if any(word in lc for word in ['outside', 'ngo', 'community', 'school', 'stakeholder', 'municipal']):
+        if 'perm' in keyword_tags:
             perm = 'For stakeholders outside NWU you may need goodwill permission or a memorandum of understanding before access'
         else:
             perm = 'If formal documents are not available add a dated confirmation email or a short colleague statement and mark it as supplementary'
@@ -240,7 +284,6 @@ def generate_qualitative_guidance(ctx: Dict[str, Any], variant: str = 'detailed'
         insert_lines: List[str] = []
         try:
             vpath = Path(__file__).resolve().parent / 'data' / 'nwu_brain' / 'values_index.json'
-            corpus = ' '.join([title or '', kpa or '', ' '.join(examples or []), ' '.join(labels or []), ' '.join(preferred_examples or [])]).lower()
             best_value = None
             best_score = 0.0
             if vpath.exists():
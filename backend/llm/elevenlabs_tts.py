@@ -6,16 +6,37 @@ Provides high-quality text-to-speech with voice cloning capabilities
 import os
 import re
 import hashlib
+import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 import requests
 
 
+# The API key is read once from the environment; it must never live in source.
+_API_KEY = os.environ.get("ELEVENLABS_API_KEY", "")
+_HEADERS = MappingProxyType({
+    "Accept": "audio/mpeg",
+    "Content-Type": "application/json",
+    "xi-api-key": _API_KEY,
+})
+
+logger = logging.getLogger(__name__)
+_missing_key_warned = False
+
+
+def _warn_if_key_missing() -> None:
+    """Log the missing-key warning once, when the first client is created."""
+    global _missing_key_warned
+    if not _API_KEY and not _missing_key_warned:
+        _missing_key_warned = True
+        logger.warning("ELEVENLABS_API_KEY is not set; ElevenLabs requests will be rejected")
+
+
 class ElevenLabsTTS:
     """ElevenLabs Text-to-Speech client for VAMP"""
     
     # ElevenLabs API Configuration
-    API_KEY = "sk_f5df7850383221d9d9f88c2bf60be84cbee16b243424af82"
     VOICE_ID = "8IucGCtU9sL8zPkuBDmp"
     API_BASE_URL = "https://api.elevenlabs.io/v1"
     
@@ -30,12 +51,9 @@ class ElevenLabsTTS:
         self.cache_dir = cache_dir or (self.project_root / "cache" / "voice" / "elevenlabs")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Headers for API requests
-        self.headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": self.API_KEY
-        }
+        # Headers for API requests (shared, read-only)
+        self.headers = _HEADERS
+        _warn_if_key_missing()
         
         print(f"ElevenLabs TTS initialized. Cache dir: {self.cache_dir}")
     
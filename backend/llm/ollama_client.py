@@ -1,24 +1,96 @@
 from __future__ import annotations
 
+import codecs
 import json
 import os
+import random
 import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except Exception as exc:  # pragma: no cover - handled at runtime
     requests = None
     _REQUESTS_IMPORT_ERROR = exc
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import demjson3
+except ImportError:  # pragma: no cover - optional dependency
+    demjson3 = None
+
+
+def _build_session():
+    """Create one keep-alive session so every Ollama call reuses pooled sockets."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
+
+# Discovery results are remembered across restarts so import stays cheap.
+HOST_CACHE_PATH = Path.home() / ".cache" / "vamp" / "ollama_host"
+HOST_CACHE_TTL = 600.0
+_DEFAULT_HOST = "http://host.docker.internal:11434"
+
+
+def _probe_host(host: str) -> bool:
+    try:
+        resp = _SESSION.head(f"{host}/api/tags", timeout=2)
+        return resp.status_code == 200
+    except Exception:
+        return False
+
+
+def _read_cached_host() -> Optional[str]:
+    try:
+        cached = json.loads(HOST_CACHE_PATH.read_text(encoding="utf-8"))
+        if float(cached.get("expires_at", 0)) > time.time():
+            return cached.get("host") or None
+    except Exception:
+        pass
+    return None
+
+
+def _write_cached_host(host: str) -> None:
+    try:
+        HOST_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        HOST_CACHE_PATH.write_text(
+            json.dumps({"host": host, "expires_at": time.time() + HOST_CACHE_TTL}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
 
 def _get_ollama_host():
     """Determine the best Ollama host URL for the current environment."""
     # If explicitly set, use that
     if "OLLAMA_HOST" in os.environ:
         return os.getenv("OLLAMA_HOST").rstrip("/")
-    
+
+    if _SESSION is None:
+        return _DEFAULT_HOST
+
+    cached = _read_cached_host()
+    if cached and _probe_host(cached):
+        return cached
+
     # Try multiple potential hosts for dev containers
     potential_hosts = [
         "http://host.docker.internal:11434",  # Docker Desktop
@@ -26,18 +98,28 @@ def _get_ollama_host():
         "http://10.0.0.1:11434",             # Codespaces gateway
         "http://127.0.0.1:11434",            # Local fallback
     ]
-    
-    if requests:
-        for host in potential_hosts:
-            try:
-                resp = requests.get(f"{host}/api/tags", timeout=2)
-                if resp.status_code == 200:
-                    return host
-            except:
-                continue
-    
+
+    # Probe in parallel but pick by preference: results are read in list
+    # order, so a lower-priority host only wins once every host above it
+    # has failed, and the choice does not depend on which answers first.
+    found: Optional[str] = None
+    pool = ThreadPoolExecutor(max_workers=len(potential_hosts))
+    try:
+        futures = [pool.submit(_probe_host, host) for host in potential_hosts]
+        for host, future in zip(potential_hosts, futures):
+            if future.result():
+                found = host
+                break
+    finally:
+        # Do not wait on lower-priority probes once a host has been chosen
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if found:
+        _write_cached_host(found)
+        return found
+
     # Default fallback
-    return "http://host.docker.internal:11434"
+    return _DEFAULT_HOST
 
 
 OLLAMA_HOST = _get_ollama_host()
@@ -45,7 +127,98 @@ OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")  # Faster and more capab
 OLLAMA_TIMEOUT = max(180.0, float(os.getenv("OLLAMA_TIMEOUT", "240")))
 OLLAMA_NUM_PREDICT = int(os.getenv("OLLAMA_NUM_PREDICT", "320"))
 OLLAMA_RETRIES = int(os.getenv("OLLAMA_RETRIES", "2"))
-OLLAMA_BACKOFFS = [2, 6]
+OLLAMA_BACKOFF_BASE = 1.0
+OLLAMA_BACKOFF_CAP = 30.0
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Only connection failures, timeouts and 5xx replies are worth retrying."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500
+    return False
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+_STREAM_DECODER = json.JSONDecoder()
+_WHITESPACE_RE = re.compile(r"\s*")
+
+
+class _ObjectEndTracker:
+    """Report when the text fed so far closes its first top-level ``{...}``.
+
+    Mirrors :func:`_first_balanced_object` but keeps its state between
+    fragments, so each streamed token is scanned once.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_str = False
+        self.escaped = False
+
+    def feed(self, fragment: str) -> bool:
+        # A backslash at the very end of the previous fragment escapes our first character.
+        escaped_until = 1 if self.escaped else -1
+        self.escaped = False
+        for match in _JSON_STRUCTURE_RE.finditer(fragment):
+            idx = match.start()
+            ch = fragment[idx]
+            if self.in_str:
+                if idx < escaped_until:
+                    continue
+                if ch == "\\":
+                    escaped_until = idx + 2
+                elif ch == '"':
+                    self.in_str = False
+            elif ch == '"':
+                if self.depth > 0:
+                    self.in_str = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        self.escaped = escaped_until > len(fragment)
+        return False
+
+
+def _read_streamed_response(response, *, stop_at_object_end: bool = False) -> str:
+    """Concatenate the ``response`` fields of Ollama's NDJSON stream as chunks arrive.
+
+    Bytes go through an incremental UTF-8 decoder into a buffer that
+    ``raw_decode`` consumes one record at a time; a record split across
+    chunks stays in the buffer until the rest arrives. Reading stops at the
+    ``done`` record or, with ``stop_at_object_end``, as soon as the generated
+    text closes its top-level JSON object.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    tracker = _ObjectEndTracker() if stop_at_object_end else None
+    parts = []
+    buffer = ""
+    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        buffer += utf8.decode(chunk)
+        pos = 0
+        while True:
+            pos = _WHITESPACE_RE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            try:
+                data, pos = _STREAM_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # partial record; wait for the next chunk
+            if data.get("error"):
+                raise RuntimeError(f"Ollama error: {data['error']}")
+            fragment = data.get("response") or ""
+            parts.append(fragment)
+            if data.get("done") or (tracker is not None and tracker.feed(fragment)):
+                return "".join(parts).strip()
+        buffer = buffer[pos:]
+    buffer += utf8.decode(b"", final=True)
+    if buffer.strip():
+        _STREAM_DECODER.decode(buffer)  # raises JSONDecodeError for a truncated record
+    return "".join(parts).strip()
 
 
 def query_ollama(prompt: str, *, model: Optional[str] = None, format: Optional[str] = None,
@@ -61,7 +234,7 @@ def query_ollama(prompt: str, *, model: Optional[str] = None, format: Optional[s
     payload: Dict[str, Any] = {
         "model": model or OLLAMA_MODEL,
         "prompt": prompt,
-        "stream": False,
+        "stream": True,
         "options": {
             "temperature": float(os.getenv("VAMP_LLM_TEMPERATURE", "0.25")),
             "num_predict": num_predict if num_predict is not None else OLLAMA_NUM_PREDICT,
@@ -74,18 +247,24 @@ def query_ollama(prompt: str, *, model: Optional[str] = None, format: Optional[s
 
     last_error: Optional[Exception] = None
     attempts = max(0, OLLAMA_RETRIES) + 1
+    request_timeout = timeout or OLLAMA_TIMEOUT
+    # Every attempt keeps the full request timeout; backoff sleeps are only
+    # taken while they fit in one request timeout per attempt overall.
+    deadline = time.monotonic() + request_timeout * attempts
+    backoff = OLLAMA_BACKOFF_BASE
     for attempt in range(attempts):
         try:
-            response = requests.post(url, json=payload, timeout=timeout or OLLAMA_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
-            return (data.get("response") or "").strip()
+            with _SESSION.post(url, json=payload, timeout=request_timeout, stream=True) as response:
+                response.raise_for_status()
+                return _read_streamed_response(response, stop_at_object_end=bool(format))
         except Exception as exc:  # requests.RequestException | json.JSONDecodeError
             last_error = exc
-            if attempt < attempts - 1:
-                backoff_idx = min(attempt, len(OLLAMA_BACKOFFS) - 1)
-                time.sleep(OLLAMA_BACKOFFS[backoff_idx])
-                continue
+            if attempt < attempts - 1 and _is_transient(exc):
+                # Decorrelated jitter keeps concurrent callers from retrying in lockstep
+                backoff = min(OLLAMA_BACKOFF_CAP, random.uniform(OLLAMA_BACKOFF_BASE, backoff * 3))
+                if time.monotonic() + backoff < deadline:
+                    time.sleep(backoff)
+                    continue
             raise
 
     if last_error:
@@ -93,50 +272,179 @@ def query_ollama(prompt: str, *, model: Optional[str] = None, format: Optional[s
     raise RuntimeError("Unknown Ollama error")
 
 
-def _balanced_brace_slice(text: str) -> str:
+# LLM replies larger than this are not scanned for an embedded object.
+JSON_SCAN_LIMIT = 256 * 1024
+
+
+# Only braces, quotes and backslashes change the scanner's state, so the
+# regex engine skips every other character at C speed.
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+def _first_balanced_object(text: str, limit: int = JSON_SCAN_LIMIT) -> Optional[str]:
+    """Return the first complete ``{...}`` object in ``text``.
+
+    Braces inside JSON string literals are ignored, so chatter or a second
+    object after the first one does not widen the slice.
+    """
+    first = text.find("{", 0, limit)
+    if first < 0:
+        return None
     depth = 0
-    start = -1
-    for idx, ch in enumerate(text):
-        if ch == "{":
+    in_str = False
+    escaped_until = -1
+    for match in _JSON_STRUCTURE_RE.finditer(text, first, limit):
+        idx = match.start()
+        ch = text[idx]
+        if in_str:
+            if idx < escaped_until:
+                continue
+            if ch == "\\":
+                escaped_until = idx + 2
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            if depth > 0:
+                in_str = True
+        elif ch == "{":
             if depth == 0:
                 start = idx
             depth += 1
         elif ch == "}" and depth > 0:
             depth -= 1
-            if depth == 0 and start != -1:
+            if depth == 0:
                 return text[start : idx + 1]
-    return ""
+    return None
+
+
+_CODE_FENCE_RE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+_TRAILING_COMMA_RE = re.compile(r",\s*(\}|\])")
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+# How often each extract_json_object stage produced the result; the "llm"
+# bucket should stay rare now that repairs are tried offline first.
+JSON_REPAIR_STATS: Counter = Counter()
+
+
+def _balance_json_text(text: str) -> str:
+    """Escape raw control characters in strings, map Python literals, and
+    close any quote or bracket a truncated reply left open."""
+    out = []
+    stack = []
+    in_str = False
+    esc = False
+    word = []
+
+    def flush_word() -> None:
+        if word:
+            token = "".join(word)
+            out.append(_PY_LITERALS.get(token, token))
+            word.clear()
+
+    for ch in text:
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+            elif ch == "\n":
+                ch = "\\n"
+            elif ch == "\r":
+                ch = "\\r"
+            elif ch == "\t":
+                ch = "\\t"
+            out.append(ch)
+            continue
+        if ch.isalpha():
+            word.append(ch)
+            continue
+        flush_word()
+        if ch == '"':
+            in_str = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif ch in "}]" and stack and stack[-1] == ch:
+            stack.pop()
+        out.append(ch)
+    flush_word()
+    if in_str:
+        out.append('"')
+    repaired = "".join(out).rstrip().rstrip(",")
+    return repaired + "".join(reversed(stack))
 
 
 def _repair_json_string(text: str) -> str:
-    repaired = text.strip()
-    repaired = re.sub(r",\s*(\}|\])", r"\1", repaired)
-    repaired = re.sub(r"'", '"', repaired)
-    return repaired
+    repaired = _CODE_FENCE_RE.sub("", text.strip())
+    repaired = _balance_json_text(repaired)
+    return _TRAILING_COMMA_RE.sub(r"\1", repaired)
+
+
+def _repair_candidates(text: str):
+    """Yield progressively more aggressive offline repairs of ``text``."""
+    repaired = _repair_json_string(text)
+    yield repaired
+    if "'" in repaired:
+        yield _repair_json_string(repaired.replace("'", '"'))
+
+
+def _loads(candidate: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(candidate)
+    return json.loads(candidate)
+
+
+class LLMJsonError(ValueError):
+    """Raised when no JSON object can be recovered from an LLM response."""
 
 
 def extract_json_object(raw_text: str) -> Dict[str, Any]:
-    """Best-effort extraction of a JSON object from an LLM response."""
+    """Best-effort extraction of a JSON object from an LLM response.
+
+    Offline repairs are exhausted before asking the model to fix its own
+    output, which costs a full generation round-trip. Raises
+    :class:`LLMJsonError` when every attempt fails.
+    """
     cleaned = (raw_text or "").strip()
     if not cleaned:
-        return "AI_FAILED"  # type: ignore[return-value]
+        JSON_REPAIR_STATS["failed"] += 1
+        raise LLMJsonError("LLM response was empty")
 
-    def _attempt_parse(candidate: str) -> Optional[Dict[str, Any]]:
+    def _attempt_parse(candidate: str, stage: str) -> Optional[Dict[str, Any]]:
         try:
-            return json.loads(candidate)
+            parsed = _loads(candidate)
         except Exception:
-            repaired = _repair_json_string(candidate)
-            try:
-                return json.loads(repaired)
-            except Exception:
-                return None
+            parsed = None
+            for repaired in _repair_candidates(candidate):
+                try:
+                    parsed = _loads(repaired)
+                except Exception:
+                    continue
+                if isinstance(parsed, dict):
+                    break
+                parsed = None
+            if parsed is None and demjson3 is not None:
+                try:
+                    parsed = demjson3.decode(candidate)
+                except Exception:
+                    parsed = None
+            stage = "repaired"
+        if not isinstance(parsed, dict):
+            return None
+        JSON_REPAIR_STATS[stage] += 1
+        return parsed
 
-    direct = _attempt_parse(cleaned)
+    direct = _attempt_parse(cleaned, "direct")
     if direct is not None:
         return direct
 
-    candidate = _balanced_brace_slice(cleaned)
-    parsed = _attempt_parse(candidate) if candidate else None
+    candidate = _first_balanced_object(cleaned) or ""
+    if not candidate and "{" in cleaned:
+        # Truncated reply: let the repair ladder close what was left open.
+        candidate = cleaned[cleaned.index("{"):]
+    parsed = _attempt_parse(candidate, "sliced") if candidate else None
     if parsed is not None:
         return parsed
 
@@ -147,11 +455,13 @@ def extract_json_object(raw_text: str) -> Dict[str, Any]:
         )
         repaired_response = query_ollama(repair_prompt, format="json", timeout=OLLAMA_TIMEOUT)
         repaired_response = (repaired_response or "").strip()
-        repaired_candidate = _balanced_brace_slice(repaired_response) or repaired_response
-        repaired = _attempt_parse(repaired_candidate)
-        if repaired is not None:
-            return repaired
-    except Exception:
-        return "AI_FAILED"  # type: ignore[return-value]
+        repaired_candidate = _first_balanced_object(repaired_response) or repaired_response
+        repaired = _attempt_parse(repaired_candidate, "llm")
+    except Exception as exc:
+        JSON_REPAIR_STATS["failed"] += 1
+        raise LLMJsonError(f"JSON repair request failed: {exc}") from exc
+    if repaired is not None:
+        return repaired
 
-    return "AI_FAILED"  # type: ignore[return-value]
+    JSON_REPAIR_STATS["failed"] += 1
+    raise LLMJsonError("No JSON object could be recovered from the LLM response")
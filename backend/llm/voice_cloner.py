@@ -6,14 +6,20 @@ This module provides voice cloning functionality using OpenVoice V2,
 allowing VAMP to speak responses using a cloned voice.
 """
 
+import contextlib
+import inspect
+import io
 import os
 import json
+import tempfile
+import threading
 import time
 import torch
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import hashlib
+from collections import OrderedDict
 
 # Will be installed via requirements
 try:
@@ -27,6 +33,12 @@ except ImportError as e:
     ToneColorConverter = None
     BaseSpeakerTTS = None
 
+try:
+    from safetensors.torch import load_file as load_safetensors, save_file as save_safetensors
+except ImportError:  # pragma: no cover - optional dependency
+    load_safetensors = None
+    save_safetensors = None
+
 # For audio file handling
 try:
     import soundfile as sf
@@ -35,6 +47,12 @@ try:
 except ImportError:
     AUDIO_LIBS_AVAILABLE = False
 
+# Synthesis settings baked into every cached clip; bump when they change.
+TTS_CACHE_VERSION = "EN/default/English/1.0"
+TTS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+TTS_WATERMARK = "@MyShell"  # Required by OpenVoice
+SPEAKER_EMBEDDING_CACHE_SIZE = 8
+
 
 class VoiceCloner:
     """OpenVoice V2 voice cloning for VAMP"""
@@ -77,17 +95,31 @@ class VoiceCloner:
         
         # Device configuration
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.inference_dtype = self._select_inference_dtype()
         print(f"VoiceCloner initialized on device: {self.device}")
         
         # Model components (loaded lazily)
         self.base_speaker = None
         self.tone_converter = None
         self.target_se = None  # Speaker embedding for cloned voice
+        self.voice_name = None  # Voice whose embedding is in target_se
         self.is_trained = False
+        self._se_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+        self._model_lock = threading.Lock()
+        self._in_memory_tts = None  # decided from the loaded OpenVoice API
         
         # Voice configuration
         self.config_file = self.cache_dir / "voice_config.json"
         self.load_config()
+        
+        # Warm the GPU models while the user is still typing; OPENVOICE_LAZY=1
+        # keeps the old load-on-first-use behaviour for tests and the CLI.
+        self._preload_thread = None
+        if self.device == "cuda" and os.environ.get("OPENVOICE_LAZY") != "1":
+            self._preload_thread = threading.Thread(
+                target=self._preload_models, name="openvoice-preload", daemon=True
+            )
+            self._preload_thread.start()
     
     def load_config(self):
         """Load voice configuration if it exists"""
@@ -108,22 +140,63 @@ class VoiceCloner:
         with open(self.config_file, 'w') as f:
             json.dump(self.config, f, indent=2)
     
+    def _select_inference_dtype(self):
+        """Reduced precision for GPU inference; VAMP_TTS_DTYPE=fp32 forces full precision"""
+        requested = os.environ.get("VAMP_TTS_DTYPE", "auto").lower()
+        if self.device != "cuda" or requested == "fp32":
+            return None
+        if requested == "fp16":
+            return torch.float16
+        if requested == "bf16" or torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+    
+    def _inference_context(self):
+        """No-grad inference, autocast to the reduced dtype on GPU"""
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self.inference_dtype is not None:
+            stack.enter_context(torch.autocast(device_type="cuda", dtype=self.inference_dtype))
+        return stack
+    
+    def _preload_models(self):
+        """Background warm-up; failures surface again on first real use"""
+        try:
+            torch.cuda.init()
+            self._load_models()
+        except Exception as e:
+            print(f"OpenVoice preload failed: {e}")
+    
     def _load_models(self):
         """Load OpenVoice models (lazy loading)"""
-        if self.base_speaker is not None:
+        if self.tone_converter is not None:
             return  # Already loaded
         
-        print("Loading OpenVoice V2 models...")
-        
-        # Load base speaker TTS model
-        ckpt_base = str(self.model_dir / "base_speakers" / "EN")
-        self.base_speaker = BaseSpeakerTTS(ckpt_base, device=self.device)
-        
-        # Load tone color converter
-        ckpt_converter = str(self.model_dir / "converter")
-        self.tone_converter = ToneColorConverter(ckpt_converter, device=self.device)
-        
-        print("Models loaded successfully")
+        # A caller racing the preload thread waits here instead of loading twice
+        with self._model_lock:
+            if self.tone_converter is not None:
+                return
+            
+            print("Loading OpenVoice V2 models...")
+            
+            # Load base speaker TTS model
+            ckpt_base = str(self.model_dir / "base_speakers" / "EN")
+            base_speaker = BaseSpeakerTTS(ckpt_base, device=self.device)
+            
+            # Load tone color converter
+            ckpt_converter = str(self.model_dir / "converter")
+            tone_converter = ToneColorConverter(ckpt_converter, device=self.device)
+            
+            # Half/bf16 weights on GPU halve model memory and bandwidth; autocast
+            # in _inference_context still reconciles fp32 inputs (spectrograms,
+            # stored embeddings). CPU keeps fp32 weights.
+            if self.inference_dtype is not None:
+                base_speaker.model.to(dtype=self.inference_dtype)
+                tone_converter.model.to(dtype=self.inference_dtype)
+            
+            self.base_speaker = base_speaker
+            self.tone_converter = tone_converter
+            print("Models loaded successfully")
     
     def train_voice(self, voice_files: List[Path], voice_name: str = "vamp_voice") -> Dict[str, Any]:
         """
@@ -156,9 +229,16 @@ class VoiceCloner:
                 vad=True  # Voice Activity Detection for better quality
             )
             
-            # Save the embedding
-            embedding_path = self.cache_dir / f"{voice_name}_embedding.pt"
-            torch.save(self.target_se, embedding_path)
+            # Save the embedding; safetensors avoids pickle and loads without copying
+            if save_safetensors is not None:
+                embedding_path = self.cache_dir / f"{voice_name}_embedding.safetensors"
+                save_safetensors({"target_se": self.target_se.detach().contiguous().cpu()}, str(embedding_path))
+            else:
+                embedding_path = self.cache_dir / f"{voice_name}_embedding.pt"
+                torch.save(self.target_se, embedding_path)
+            
+            self.voice_name = voice_name
+            self._remember_embedding(voice_name, self.target_se)
             
             # Update config
             self.config['is_trained'] = True
@@ -195,15 +275,33 @@ class VoiceCloner:
         Returns:
             True if successfully loaded
         """
-        embedding_path = self.cache_dir / f"{voice_name}_embedding.pt"
+        # Switching back to a recently used voice skips the disk read and device copy
+        cached = self._se_cache.get(voice_name)
+        if cached is not None:
+            self._se_cache.move_to_end(voice_name)
+            self.target_se = cached
+            self.voice_name = voice_name
+            self.is_trained = True
+            return True
         
-        if not embedding_path.exists():
+        safetensors_path = self.cache_dir / f"{voice_name}_embedding.safetensors"
+        legacy_path = self.cache_dir / f"{voice_name}_embedding.pt"
+        
+        if load_safetensors is not None and safetensors_path.exists():
+            embedding_path = safetensors_path
+        elif legacy_path.exists():
+            embedding_path = legacy_path  # Pre-safetensors embeddings; kept readable for one release
+        else:
             print(f"No trained voice found: {voice_name}")
             return False
         
         try:
-            self._load_models()
-            self.target_se = torch.load(embedding_path, map_location=self.device)
+            if embedding_path.suffix == ".safetensors":
+                self.target_se = load_safetensors(str(embedding_path), device=self.device)["target_se"]
+            else:
+                self.target_se = torch.load(embedding_path, map_location=self.device)
+            self.voice_name = voice_name
+            self._remember_embedding(voice_name, self.target_se)
             self.is_trained = True
             print(f"✓ Loaded trained voice: {voice_name}")
             return True
@@ -211,6 +309,13 @@ class VoiceCloner:
             print(f"✗ Failed to load voice: {e}")
             return False
     
+    def _remember_embedding(self, voice_name: str, target_se):
+        """Keep the most recently used speaker embeddings resident on the device"""
+        self._se_cache[voice_name] = target_se
+        self._se_cache.move_to_end(voice_name)
+        while len(self._se_cache) > SPEAKER_EMBEDDING_CACHE_SIZE:
+            self._se_cache.popitem(last=False)
+    
     def text_to_speech(self, text: str, output_path: Optional[Path] = None) -> Optional[Path]:
         """
         Convert text to speech using the cloned voice
@@ -222,43 +327,54 @@ class VoiceCloner:
         Returns:
             Path to generated audio file, or None if failed
         """
-        if not self.is_trained:
-            # Try to load default voice
-            if not self.load_trained_voice():
+        if self.target_se is None:
+            # Try to load the configured (or default) voice
+            if not self.load_trained_voice(self.config.get('voice_name', 'vamp_voice')):
                 raise RuntimeError("No trained voice available. Please train a voice first.")
         
+        # Identical text in the same voice is served from disk without touching the models
+        cached = False
+        if output_path is None:
+            output_path = self._speech_cache_path(text)
+            if output_path.exists() and output_path.stat().st_size > 0:
+                os.utime(output_path)  # keep the hit at the young end of the LRU
+                print(f"✓ Speech cache hit: {output_path.name}")
+                return output_path
+            cached = True
+        
         # Load models if needed
         self._load_models()
         
-        # Generate output path if not provided
-        if output_path is None:
-            # Create hash of text for caching
-            text_hash = hashlib.md5(text.encode()).hexdigest()[:8]
-            timestamp = int(time.time())
-            output_path = self.cache_dir / f"speech_{timestamp}_{text_hash}.wav"
-        
+        render_path = None
         try:
-            # Generate base speech with neutral voice
-            temp_base = self.cache_dir / f"temp_base_{int(time.time())}.wav"
+            # Write beside the target and rename so readers never see a partial clip
+            with tempfile.NamedTemporaryFile(
+                dir=output_path.parent, prefix=f".{output_path.stem}.", suffix=".wav", delete=False
+            ) as tf:
+                render_path = Path(tf.name)
             
             print(f"Generating speech for: {text[:50]}...")
             
-            # Use base speaker to generate initial audio
-            self.base_speaker.tts(text, str(temp_base), speaker='default', language='English', speed=1.0)
+            if self._in_memory_tts is None:
+                self._in_memory_tts = self._supports_in_memory_tts()
+                if not self._in_memory_tts:
+                    print("OpenVoice build lacks the in-memory TTS API; using temp files")
             
-            # Convert tone color to match target voice
-            encode_message = "@MyShell"  # Required by OpenVoice
-            self.tone_converter.convert(
-                audio_src_path=str(temp_base),
-                src_se=None,  # Auto-extract from source
-                tgt_se=self.target_se,
-                output_path=str(output_path),
-                message=encode_message
-            )
+            with self._inference_context():
+                if self._in_memory_tts:
+                    try:
+                        self._render_in_memory(text, render_path)
+                    except Exception as e:
+                        # Reported once; every later request goes straight to temp files
+                        print(f"In-memory synthesis failed, falling back to temp files: {e}")
+                        self._in_memory_tts = False
+                if not self._in_memory_tts:
+                    self._render_via_temp_file(text, render_path)
+            
+            os.replace(render_path, output_path)
             
-            # Clean up temp file
-            if temp_base.exists():
-                temp_base.unlink()
+            if cached:
+                self._prune_speech_cache()
             
             print(f"✓ Speech generated: {output_path.name}")
             return output_path
@@ -266,6 +382,97 @@ class VoiceCloner:
         except Exception as e:
             print(f"✗ Speech generation failed: {e}")
             return None
+        finally:
+            if render_path is not None:
+                render_path.unlink(missing_ok=True)
+    
+    def _supports_in_memory_tts(self) -> bool:
+        """True when the loaded models expose the API ``_render_in_memory`` relies on
+        
+        OpenVoice's ``BaseSpeakerTTS.tts`` returns the waveform when
+        ``output_path`` is None, and ``ToneColorConverter.convert`` reads its
+        source through librosa, which also accepts file objects.
+        """
+        try:
+            tts_params = inspect.signature(self.base_speaker.tts).parameters
+            convert_params = inspect.signature(self.tone_converter.convert).parameters
+        except (TypeError, ValueError):
+            return False
+        return "output_path" in tts_params and {"audio_src_path", "output_path"} <= convert_params.keys()
+    
+    def _render_in_memory(self, text: str, render_path: Path):
+        """Synthesize base speech into a WAV buffer and tone-convert it without touching disk"""
+        audio = self.base_speaker.tts(text, None, speaker='default', language='English', speed=1.0)
+        if not isinstance(audio, np.ndarray):
+            raise TypeError(f"tts(output_path=None) returned {type(audio).__name__}, not audio samples")
+        buffer = io.BytesIO()
+        sf.write(buffer, audio, self.base_speaker.hps.data.sampling_rate, format='WAV')
+        buffer.seek(0)
+        self.tone_converter.convert(
+            audio_src_path=buffer,
+            src_se=None,  # Auto-extract from source
+            tgt_se=self.target_se,
+            output_path=str(render_path),
+            message=TTS_WATERMARK
+        )
+    
+    def _render_via_temp_file(self, text: str, render_path: Path):
+        """Round-trip the base speech through a temporary WAV file"""
+        temp_base = None
+        try:
+            # A unique name per call, so concurrent requests cannot clobber each other
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix="tts_", suffix=".wav", delete=False) as tf:
+                temp_base = Path(tf.name)
+            
+            # Use base speaker to generate initial audio
+            self.base_speaker.tts(text, str(temp_base), speaker='default', language='English', speed=1.0)
+            
+            # Convert tone color to match target voice
+            self.tone_converter.convert(
+                audio_src_path=str(temp_base),
+                src_se=None,  # Auto-extract from source
+                tgt_se=self.target_se,
+                output_path=str(render_path),
+                message=TTS_WATERMARK
+            )
+        finally:
+            if temp_base is not None:
+                temp_base.unlink(missing_ok=True)
+    
+    def _speech_cache_path(self, text: str) -> Path:
+        """Cache location for ``text`` spoken in the current trained voice"""
+        voice_name = self.voice_name or self.config.get('voice_name', 'vamp_voice')
+        digest = hashlib.blake2b(digest_size=12)
+        for part in (TTS_CACHE_VERSION, str(self.config.get('last_trained')), text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        voice_dir = self.cache_dir / voice_name
+        voice_dir.mkdir(parents=True, exist_ok=True)
+        return voice_dir / f"{digest.hexdigest()}.wav"
+    
+    def _prune_speech_cache(self, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        """Delete least recently used cached clips once the cache exceeds ``max_bytes``"""
+        clips = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.wav"):
+            if path.name.startswith("."):
+                continue  # a render still being written by text_to_speech
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            clips.append((max(st.st_atime, st.st_mtime), st.st_size, path))
+            total += st.st_size
+        if total <= max_bytes:
+            return
+        for _, size, path in sorted(clips):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
     
     def get_training_files(self) -> List[Path]:
         """Get list of available training files"""
@@ -283,6 +490,7 @@ class VoiceCloner:
             'openvoice_available': OPENVOICE_AVAILABLE,
             'audio_libs_available': AUDIO_LIBS_AVAILABLE,
             'device': self.device,
+            'inference_dtype': str(self.inference_dtype or torch.float32),
             'models_loaded': self.base_speaker is not None,
             'is_trained': self.is_trained,
             'config': self.config,
@@ -15,24 +15,72 @@ but it respects your existing heuristic JSONs and keeps scoring deterministic.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 
+try:
+    import orjson  # optional: faster brain decoding
+    _jloads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency
+    _jloads = json.loads
+
+try:
+    import ahocorasick  # optional: one-pass policy literal matching
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:  # Python 3.11+
+    from re import _constants as _sre_constants, _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+
 
 BASE_DIR = Path(__file__).resolve().parent
 BRAIN_DIR = BASE_DIR / "data" / "nwu_brain"
+SCORE_CACHE_DIR = BRAIN_DIR.parent / "score_cache"
+SCORE_MEMO_SIZE = 4096
+# Part of every score cache key; bump whenever scoring results can change
+SCORER_VERSION = "2"
+SCORE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# The on-disk cache is checked against its size cap once per this many writes
+SCORE_CACHE_PRUNE_EVERY = 256
+
+BRAIN_FILES = (
+    "kpa_router.json",
+    "values_index.json",
+    "tier_keywords.json",
+    "institution_profile.json",
+    "policy_registry.json",
+)
 
 
-def _load_json(name: str) -> Any:
-    path = BRAIN_DIR / name
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+# ---------- Data containers ----------
 
+@dataclass(frozen=True)
+class KPARoute:
+    """One KPA's router entry, normalised so scoring loops need no dict lookups."""
+    extensions: frozenset
+    filename_cues: Tuple[re.Pattern, ...]
+    content_regex: Tuple[re.Pattern, ...]
+    negative_cues: Tuple[re.Pattern, ...]
+
+
+@dataclass(frozen=True)
+class RouteWeights:
+    extension: float = 0.5
+    filename: float = 1.0
+    content: float = 2.0
+    negative: float = -2.5
+    min_route_score: float = 1.5
 
-# ---------- Data containers ----------
 
 @dataclass
 class BrainConfig:
@@ -41,21 +89,296 @@ class BrainConfig:
     tier_keywords: Dict[str, List[str]]
     institution_profile: Dict[str, Any]
     policy_registry: Dict[str, Any]
-
+    # Digest of the brain JSON files; cached scores are only valid for it
+    version: str = ""
+    # Patterns compiled once at load time; invalid regexes are dropped here
+    kpa_routes: Dict[str, KPARoute] = field(default_factory=dict)
+    route_weights: RouteWeights = field(default_factory=RouteWeights)
+    # (id, name, [(pattern, weight)]) per core value
+    value_patterns: List[Tuple[Any, Any, List[Tuple[re.Pattern, float]]]] = field(default_factory=list)
+    tier_patterns: Dict[str, List[re.Pattern]] = field(default_factory=dict)
+    # (code, hit record, patterns) per policy; the record is copied on a match
+    policy_patterns: List[Tuple[str, Dict[str, Any], List[re.Pattern]]] = field(default_factory=list)
+    # Aho-Corasick automaton over the case-folded policy literals (optional)
+    policy_automaton: Any = None
+    # Case-folded literals one of which every match must contain (None: unknown)
+    pattern_literals: Dict[re.Pattern, Tuple[str, ...] | None] = field(default_factory=dict)
+    # Case-sensitive twins of IGNORECASE patterns, for searching lower-cased text
+    lowered_patterns: Dict[re.Pattern, re.Pattern] = field(default_factory=dict)
+
+
+# Non-ASCII characters whose str.lower() disagrees with re.IGNORECASE matching
+# against ASCII patterns (found by checking every code point). It also covers
+# str.casefold(): re.IGNORECASE equates "\u0130" and "\u0131" with "i", which
+# casefolding does not, so neither view can prefilter text containing them.
+_FOLD_UNSAFE_RE = re.compile("[\u0130\u0131\u017f\u212a]")
+# Scoped inline flags such as (?-i:...) would change meaning once lower-cased
+_SCOPED_FLAGS_RE = re.compile(r"\(\?[aiLmsux]*-?[aiLmsux]*[:)]")
+
+
+@dataclass(frozen=True)
+class TextViews:
+    """Views of one document's text, prepared once and shared by every scorer."""
+    text: str
+    folded: str | None  # case-folded, for the literal prefilters; None when unsafe
+    lowered: str | None  # lower-cased, for IGNORECASE-free twins; None when unsafe
+
+
+def _text_views(text: str) -> TextViews:
+    if text.isascii():
+        folded: str | None = text.casefold()
+        lowered: str | None = folded
+    elif _FOLD_UNSAFE_RE.search(text):
+        folded = lowered = None
+    else:
+        folded = text.casefold()
+        lowered = text.lower()
+    return TextViews(text=text, folded=folded, lowered=lowered)
+
+
+KPA_CODES = ("KPA1", "KPA2", "KPA3", "KPA4", "KPA5")
+_KPA_PATTERN_KEYS = ("filename_cues", "content_regex", "negative_cues")
+_DEFAULT_FLAGS = re.IGNORECASE | re.MULTILINE
 
 _BRAIN: BrainConfig | None = None
+_BRAIN_LOCK = threading.Lock()
+
+
+def _compile(pattern: str, flags: int) -> re.Pattern | None:
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+def _compile_all(patterns: List[str], flags: int) -> List[re.Pattern]:
+    compiled = (_compile(p, flags) for p in patterns if p)
+    return [c for c in compiled if c is not None]
+
+
+def _literal_candidates(seq: Any) -> set | None:
+    """Best literal set for a parsed sequence: any match contains one of them."""
+    best: set | None = None
+    run: List[str] = []
+
+    def consider(candidates: set | None) -> None:
+        nonlocal best
+        if candidates and (best is None or min(map(len, candidates)) > min(map(len, best))):
+            best = candidates
+
+    for op, av in seq:
+        if op is _sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op is _sre_constants.AT:  # zero-width, keeps the run contiguous
+            continue
+        if run:
+            consider({"".join(run)})
+            run = []
+        if op is _sre_constants.SUBPATTERN:
+            consider(_literal_candidates(av[-1]))
+        elif op is _sre_constants.BRANCH:
+            branches = [_literal_candidates(branch) for branch in av[1]]
+            if all(branches):
+                consider(set().union(*branches))
+        elif op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) and av[0] >= 1:
+            consider(_literal_candidates(av[2]))
+    if run:
+        consider({"".join(run)})
+    return best
+
+
+def _required_literals(pattern: re.Pattern) -> Tuple[str, ...] | None:
+    """Case-folded literals of which every match of ``pattern`` contains one.
+
+    Used as a cheap ``in`` prefilter: when none occur in the case-folded
+    text the regex cannot match, so it is not run at all.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern.pattern, pattern.flags)
+        candidates = _literal_candidates(list(parsed))
+    except Exception:
+        return None
+    if not candidates or any(_FOLD_UNSAFE_RE.search(lit) for lit in candidates):
+        return None
+    return tuple(sorted({lit.casefold() for lit in candidates}))
+
+
+def _has_upper(seq: Any) -> bool:
+    """True when a parsed pattern can only match some upper-case character."""
+    for op, av in seq:
+        if op in (_sre_constants.LITERAL, _sre_constants.NOT_LITERAL):
+            if chr(av).lower() != chr(av):
+                return True
+        elif op is _sre_constants.RANGE:
+            lo, hi = av
+            if hi - lo > 0x3000 or any(chr(c).lower() != chr(c) for c in range(lo, hi + 1)):
+                return True
+        elif op is _sre_constants.IN:
+            if _has_upper(av):
+                return True
+        elif any(_has_upper(sub) for sub in _subpatterns(av)):
+            return True
+    return False
+
+
+def _subpatterns(av: Any):
+    if isinstance(av, _sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (list, tuple)):
+        for item in av:
+            yield from _subpatterns(item)
+
+
+def _lowered_variant(pattern: re.Pattern) -> re.Pattern | None:
+    """Case-sensitive twin of an IGNORECASE ``pattern`` for lower-cased text.
+
+    Only ASCII patterns qualify; the twin is refused when escapes or scoped
+    flags would leave it able to match upper-case characters.
+    """
+    source = pattern.pattern
+    if not pattern.flags & re.IGNORECASE or not source.isascii() or _SCOPED_FLAGS_RE.search(source):
+        return None
+    # Lower-case everything except escape sequences (\B, \S, \W, ...)
+    lowered = re.sub(r"\\.|[^\\]+", lambda m: m.group() if m.group()[0] == "\\" else m.group().lower(), source)
+    flags = pattern.flags & ~re.IGNORECASE
+    try:
+        if _has_upper(_sre_parse.parse(lowered, flags)):
+            return None
+        return re.compile(lowered, flags)
+    except Exception:
+        return None
+
+
+def _literals_present(brain: BrainConfig, pattern: re.Pattern, views: TextViews) -> bool:
+    literals = brain.pattern_literals.get(pattern)
+    return literals is None or views.folded is None or any(lit in views.folded for lit in literals)
+
+
+def _search(brain: BrainConfig, pattern: re.Pattern, views: TextViews) -> bool:
+    if views.lowered is not None:
+        twin = brain.lowered_patterns.get(pattern)
+        if twin is not None:
+            return twin.search(views.lowered) is not None
+    return pattern.search(views.text) is not None
+
+
+def _may_match(brain: BrainConfig, pattern: re.Pattern, views: TextViews) -> bool:
+    return _literals_present(brain, pattern, views) and _search(brain, pattern, views)
+
+
+def _router_flags(router: Dict[str, Any]) -> int:
+    flags_str = router.get("defaults", {}).get("regex_flags", "i,m")
+    flags = 0
+    if "i" in flags_str:
+        flags |= re.IGNORECASE
+    if "m" in flags_str:
+        flags |= re.MULTILINE
+    return flags
+
+
+def _compile_brain(brain: BrainConfig) -> None:
+    # Patterns stay separate rather than fused into one big alternation:
+    # CPython's backtracking ``re`` then tries every branch at every offset
+    # and loses each pattern's own prefix scan, which measured 2-20x slower
+    # per category on these packs than searching the patterns one by one.
+    router_flags = _router_flags(brain.kpa_router)
+    for kpa_code in KPA_CODES:
+        cfg = brain.kpa_router.get(kpa_code, {})
+        compiled = {key: tuple(_compile_all(cfg.get(key, []), router_flags)) for key in _KPA_PATTERN_KEYS}
+        brain.kpa_routes[kpa_code] = KPARoute(extensions=frozenset(cfg.get("extensions", [])), **compiled)
+
+    defaults = brain.kpa_router.get("defaults", {})
+    weights = defaults.get("score_weights", {})
+    brain.route_weights = RouteWeights(
+        extension=float(weights.get("extension_cues", 0.5)),
+        filename=float(weights.get("filename_cues", 1.0)),
+        content=float(weights.get("content_regex", 2.0)),
+        negative=float(weights.get("negative_cues", -2.5)),
+        min_route_score=defaults.get("min_route_score", 1.5),
+    )
+
+    for v in brain.values_index.get("core_values", []):
+        keywords: List[Tuple[re.Pattern, float]] = []
+        for kw in v.get("keywords", []):
+            compiled = _compile(kw["pattern"], _DEFAULT_FLAGS) if kw.get("pattern") else None
+            if compiled is not None:
+                keywords.append((compiled, float(kw.get("weight", 1.0))))
+        brain.value_patterns.append((v.get("id"), v.get("name"), keywords))
+
+    for tier_name, phrases in brain.tier_keywords.items():
+        brain.tier_patterns[tier_name] = _compile_all(phrases, _DEFAULT_FLAGS)
+
+    for code, cfg in brain.policy_registry.items():
+        literals = [cfg.get("title", "")]
+        literals.extend(alias.replace("_", " ") for alias in cfg.get("aliases", []))
+        patterns = _compile_all([re.escape(lit) for lit in literals if lit], _DEFAULT_FLAGS)
+        hit = {
+            "id": cfg.get("id") or cfg.get("code") or code,
+            "code": code,
+            "title": cfg.get("title", ""),
+            "must_pass": bool(cfg.get("must_pass", False)),
+            "severity": cfg.get("severity", "med"),
+        }
+        brain.policy_patterns.append((code, hit, patterns))
+
+    brain.policy_automaton = _build_policy_automaton(brain.policy_registry)
+
+    text_patterns: List[re.Pattern] = []
+    for route in brain.kpa_routes.values():
+        text_patterns.extend(route.content_regex)
+        text_patterns.extend(route.negative_cues)
+    text_patterns.extend(pattern for _, _, keywords in brain.value_patterns for pattern, _ in keywords)
+    text_patterns.extend(pattern for patterns in brain.tier_patterns.values() for pattern in patterns)
+    text_patterns.extend(pattern for _, _, patterns in brain.policy_patterns for pattern in patterns)
+    for pattern in text_patterns:
+        brain.pattern_literals[pattern] = _required_literals(pattern)
+        twin = _lowered_variant(pattern)
+        if twin is not None:
+            brain.lowered_patterns[pattern] = twin
+
+
+def _build_policy_automaton(policy_registry: Dict[str, Any]) -> Any:
+    if ahocorasick is None:
+        return None
+    codes_by_literal: Dict[str, List[str]] = {}
+    for code, cfg in policy_registry.items():
+        literals = [cfg.get("title", "")]
+        literals.extend(alias.replace("_", " ") for alias in cfg.get("aliases", []))
+        for literal in literals:
+            if literal:
+                if _FOLD_UNSAFE_RE.search(literal):
+                    return None  # the folded literal could miss an IGNORECASE match
+                codes_by_literal.setdefault(literal.casefold(), []).append(code)
+    if not codes_by_literal:
+        return None
+    automaton = ahocorasick.Automaton()
+    for literal, codes in codes_by_literal.items():
+        automaton.add_word(literal, tuple(codes))
+    automaton.make_automaton()
+    return automaton
 
 
 def load_brain() -> BrainConfig:
     global _BRAIN
     if _BRAIN is None:
-        _BRAIN = BrainConfig(
-            kpa_router=_load_json("kpa_router.json"),
-            values_index=_load_json("values_index.json"),
-            tier_keywords=_load_json("tier_keywords.json"),
-            institution_profile=_load_json("institution_profile.json"),
-            policy_registry=_load_json("policy_registry.json"),
-        )
+        with _BRAIN_LOCK:
+            if _BRAIN is None:
+                # Each file is read once, for both decoding and the version digest
+                raw = {name: (BRAIN_DIR / name).read_bytes() for name in BRAIN_FILES}
+                digest = hashlib.blake2b(digest_size=16)
+                for name in BRAIN_FILES:
+                    digest.update(raw[name])
+                brain = BrainConfig(
+                    kpa_router=_jloads(raw["kpa_router.json"]),
+                    values_index=_jloads(raw["values_index.json"]),
+                    tier_keywords=_jloads(raw["tier_keywords.json"]),
+                    institution_profile=_jloads(raw["institution_profile.json"]),
+                    policy_registry=_jloads(raw["policy_registry.json"]),
+                    version=digest.hexdigest(),
+                )
+                _compile_brain(brain)
+                _BRAIN = brain
     return _BRAIN
 
 
@@ -66,55 +389,34 @@ def _score_kpa_for_text(
     extension: str,
     text: str,
     kpa_hint_code: str | None = None,
+    views: TextViews | None = None,
 ) -> Tuple[str, Dict[str, float]]:
     brain = load_brain()
-    router = brain.kpa_router
-    defaults = router.get("defaults", {})
-    weights = defaults.get("score_weights", {})
-    flags_str = defaults.get("regex_flags", "i,m")
-    flags = 0
-    if "i" in flags_str:
-        flags |= re.IGNORECASE
-    if "m" in flags_str:
-        flags |= re.MULTILINE
-
-    min_route_score = defaults.get("min_route_score", 1.5)
+    if views is None:
+        views = _text_views(text)
+    routes = brain.kpa_routes
+    weights = brain.route_weights
     fname = filename.lower()
     ext = extension.lower().lstrip(".")
-    scores: Dict[str, float] = {}
-
-    for kpa_code in ("KPA1", "KPA2", "KPA3", "KPA4", "KPA5"):
-        cfg = router.get(kpa_code, {})
-        score = 0.0
 
-        # Extension cues
-        extensions = cfg.get("extensions", [])
-        if ext in extensions:
-            score += float(weights.get("extension_cues", 0.5))
-
-        # Filename cues
-        for pat in cfg.get("filename_cues", []):
-            try:
-                if re.search(pat, fname, flags):
-                    score += float(weights.get("filename_cues", 1.0))
-            except re.error:
-                continue
+    # Every KPA is scored in full: the scores are returned as
+    # kpa_route_scores (and cached), so none may be left as an estimate.
+    scores: Dict[str, float] = {}
+    for kpa_code, route in routes.items():
+        score = weights.extension if ext in route.extensions else 0.0
+        for pat in route.filename_cues:
+            if pat.search(fname):
+                score += weights.filename
 
         # Content regex
-        for pat in cfg.get("content_regex", []):
-            try:
-                if re.search(pat, text, flags):
-                    score += float(weights.get("content_regex", 2.0))
-            except re.error:
-                continue
+        for pat in route.content_regex:
+            if _may_match(brain, pat, views):
+                score += weights.content
 
         # Negative cues
-        for pat in cfg.get("negative_cues", []):
-            try:
-                if re.search(pat, text, flags) or re.search(pat, fname, flags):
-                    score += float(weights.get("negative_cues", -2.5))
-            except re.error:
-                continue
+        for pat in route.negative_cues:
+            if _may_match(brain, pat, views) or pat.search(fname):
+                score += weights.negative
 
         scores[kpa_code] = score
 
@@ -131,7 +433,7 @@ def _score_kpa_for_text(
             best_score = hint_score
 
     # If everything is below threshold and we have a hint, fall back to hint
-    if best_score < min_route_score and kpa_hint_code:
+    if best_score < weights.min_route_score and kpa_hint_code:
         best_kpa = kpa_hint_code
 
     return best_kpa, scores
@@ -139,32 +441,25 @@ def _score_kpa_for_text(
 
 # ---------- Values scoring ----------
 
-def _score_values(text: str) -> Dict[str, Any]:
+def _score_values(text: str, views: TextViews | None = None) -> Dict[str, Any]:
     brain = load_brain()
-    core_values = brain.values_index.get("core_values", [])
-    flags = re.IGNORECASE | re.MULTILINE
+    if views is None:
+        views = _text_views(text)
 
     hits: List[Dict[str, Any]] = []
     total_weight = 0.0
 
-    for v in core_values:
+    for value_id, value_name, keywords in brain.value_patterns:
         v_score = 0.0
-        for kw in v.get("keywords", []):
-            pattern = kw.get("pattern")
-            weight = float(kw.get("weight", 1.0))
-            if not pattern:
-                continue
-            try:
-                if re.search(pattern, text, flags):
-                    v_score += weight
-            except re.error:
-                continue
+        for pattern, weight in keywords:
+            if _may_match(brain, pattern, views):
+                v_score += weight
 
         if v_score > 0:
             hits.append(
                 {
-                    "id": v.get("id"),
-                    "name": v.get("name"),
+                    "id": value_id,
+                    "name": value_name,
                     "score": v_score,
                 }
             )
@@ -183,21 +478,14 @@ def _score_values(text: str) -> Dict[str, Any]:
 
 # ---------- Tier scoring ----------
 
-def _score_tier(text: str) -> Tuple[str, Dict[str, int]]:
+def _score_tier(text: str, views: TextViews | None = None) -> Tuple[str, Dict[str, int]]:
     brain = load_brain()
-    tiers = brain.tier_keywords
-    flags = re.IGNORECASE | re.MULTILINE
+    if views is None:
+        views = _text_views(text)
 
     scores: Dict[str, int] = {}
-    for tier_name, phrases in tiers.items():
-        count = 0
-        for phrase in phrases:
-            try:
-                if re.search(phrase, text, flags):
-                    count += 1
-            except re.error:
-                continue
-        scores[tier_name] = count
+    for tier_name, patterns in brain.tier_patterns.items():
+        scores[tier_name] = sum(1 for pattern in patterns if _may_match(brain, pattern, views))
 
     # Default if nothing matched
     if not scores:
@@ -212,47 +500,25 @@ def _score_tier(text: str) -> Tuple[str, Dict[str, int]]:
 
 # ---------- Policy scoring ----------
 
-def _score_policies(text: str) -> Dict[str, Any]:
+def _score_policies(text: str, views: TextViews | None = None) -> Dict[str, Any]:
     brain = load_brain()
-    registry = brain.policy_registry
-    flags = re.IGNORECASE | re.MULTILINE
+    if views is None:
+        views = _text_views(text)
 
     hits: List[Dict[str, Any]] = []
 
-    for code, cfg in registry.items():
-        title = cfg.get("title", "")
-        aliases = cfg.get("aliases", [])
-        matched = False
-
-        # Match on title
-        if title:
-            try:
-                if re.search(re.escape(title), text, flags):
-                    matched = True
-            except re.error:
-                pass
-
-        # Match on aliases (e.g. ETHICS_POLICY etc.)
-        if not matched:
-            for alias in aliases:
-                alias_text = alias.replace("_", " ")
-                try:
-                    if re.search(re.escape(alias_text), text, flags):
-                        matched = True
-                        break
-                except re.error:
-                    continue
-
-        if matched:
-            hits.append(
-                {
-                    "id": cfg.get("id") or cfg.get("code") or code,
-                    "code": code,
-                    "title": title,
-                    "must_pass": bool(cfg.get("must_pass", False)),
-                    "severity": cfg.get("severity", "med"),
-                }
-            )
+    # One automaton pass yields the candidate policies; the regex confirms
+    # them so case-folding corner cases (e.g. "ss" vs "ß") do not slip in.
+    candidates = None
+    if brain.policy_automaton is not None and views.folded is not None:
+        candidates = {code for _, codes in brain.policy_automaton.iter(views.folded) for code in codes}
+
+    for code, hit, patterns in brain.policy_patterns:
+        if candidates is not None and code not in candidates:
+            continue
+        # Title first, then aliases (e.g. ETHICS_POLICY -> "ETHICS POLICY")
+        if any(_may_match(brain, pattern, views) for pattern in patterns):
+            hits.append(dict(hit))
 
     return {
         "hits": hits,
@@ -310,6 +576,94 @@ def _aggregate_score(tier_label: str, values_score: float, policy_hits: Dict[str
     return rating_raw, band_label
 
 
+# ---------- Score cache ----------
+
+# key -> serialized result; JSON keeps callers from mutating cached entries
+_SCORE_MEMO: "OrderedDict[str, str]" = OrderedDict()
+_writes_since_prune = 0
+
+
+def _score_cache_key(filename: str, full_text: str, kpa_hint_code: str | None) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(full_text.encode("utf-8", "ignore"))
+    digest.update(b"\0" + filename.encode("utf-8", "ignore"))
+    digest.update(b"\0" + str(kpa_hint_code).encode("utf-8"))
+    digest.update(b"\0" + load_brain().version.encode("ascii"))
+    digest.update(b"\0" + SCORER_VERSION.encode("ascii"))
+    return digest.hexdigest()
+
+
+def _score_cache_path(key: str) -> Path:
+    return SCORE_CACHE_DIR / key[:2] / key[2:]
+
+
+def _remember(key: str, serialized: str) -> None:
+    _SCORE_MEMO[key] = serialized
+    _SCORE_MEMO.move_to_end(key)
+    if len(_SCORE_MEMO) > SCORE_MEMO_SIZE:
+        _SCORE_MEMO.popitem(last=False)
+
+
+def _read_score_cache(key: str) -> Dict[str, Any] | None:
+    serialized = _SCORE_MEMO.get(key)
+    if serialized is None:
+        path = _score_cache_path(key)
+        try:
+            serialized = path.read_text(encoding="utf-8")
+            os.utime(path)  # keep the hit at the young end of the LRU
+        except OSError:
+            return None
+    try:
+        result = json.loads(serialized)
+    except ValueError:
+        return None
+    _remember(key, serialized)
+    return result
+
+
+def _write_score_cache(key: str, result: Dict[str, Any]) -> None:
+    global _writes_since_prune
+    serialized = json.dumps(result)
+    _remember(key, serialized)
+    path = _score_cache_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(serialized, encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        return
+    _writes_since_prune += 1
+    if _writes_since_prune >= SCORE_CACHE_PRUNE_EVERY:
+        _writes_since_prune = 0
+        _prune_score_cache()
+
+
+def _prune_score_cache(max_bytes: int = SCORE_CACHE_MAX_BYTES) -> None:
+    """Delete least recently used cached scores once the cache exceeds ``max_bytes``"""
+    entries = []
+    total = 0
+    for path in SCORE_CACHE_DIR.glob("*/*"):
+        if path.suffix == ".tmp":
+            continue  # a write still in progress
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+        total += st.st_size
+    if total <= max_bytes:
+        return
+    for _, size, path in sorted(entries):
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
+
 # ---------- Public API ----------
 
 def brain_score_evidence(
@@ -321,13 +675,30 @@ def brain_score_evidence(
     """
     Compute deterministic NWU scoring for a single evidence artefact.
 
+    Results are cached by content, filename, hint, brain version and
+    ``SCORER_VERSION``, in memory and under ``SCORE_CACHE_DIR`` (capped at
+    ``SCORE_CACHE_MAX_BYTES``), so re-opening an artefact is free.
+
     Returns a dict that can be merged into the existing ctx used by the GUI.
     """
+    key = _score_cache_key(path.name, full_text, kpa_hint_code)
+    cached = _read_score_cache(key)
+    if cached is not None:
+        return cached
+
+    result = _score_evidence(path=path, full_text=full_text, kpa_hint_code=kpa_hint_code)
+    _write_score_cache(key, result)
+    return result
+
+
+def _score_evidence(*, path: Path, full_text: str, kpa_hint_code: str | None) -> Dict[str, Any]:
     inst = load_brain().institution_profile
     kpas = inst.get("kpas", {})
 
     filename = path.name
     ext = path.suffix
+    # Case-folded and lower-cased once for every scorer
+    views = _text_views(full_text)
 
     # KPA routing
     primary_kpa_code, kpa_scores = _score_kpa_for_text(
@@ -335,17 +706,21 @@ def brain_score_evidence(
         extension=ext,
         text=full_text,
         kpa_hint_code=kpa_hint_code,
+        views=views,
     )
     primary_kpa_name = kpas.get(primary_kpa_code, primary_kpa_code)
 
+    # The scorers run one after another on purpose: ``_sre`` holds the GIL
+    # while matching, so a thread pool over them measured no faster.
+
     # Values
-    values = _score_values(full_text)
+    values = _score_values(full_text, views)
 
     # Tier
-    tier_label, tier_scores = _score_tier(full_text)
+    tier_label, tier_scores = _score_tier(full_text, views)
 
     # Policies
-    policies = _score_policies(full_text)
+    policies = _score_policies(full_text, views)
 
     # Aggregate
     rating_raw, rating_label = _aggregate_score(
@@ -1,9 +1,10 @@
 """NWU-format specific parsers and helpers."""
 
 try:  # pragma: no cover - optional dependency convenience import
-    from .ta_parser import parse_nwu_ta, PerformanceContract, PerformanceKPA  # noqa: F401
+    from .ta_parser import parse_nwu_ta, parse_nwu_ta_batch, PerformanceContract, PerformanceKPA  # noqa: F401
 except ModuleNotFoundError:  # pragma: no cover
     parse_nwu_ta = None
+    parse_nwu_ta_batch = None
     PerformanceContract = None
     PerformanceKPA = None
 
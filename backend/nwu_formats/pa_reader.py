@@ -3,56 +3,10 @@
 from __future__ import annotations
 
 import zipfile
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
 
-
-XML_NS = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
-          "rel": "http://schemas.openxmlformats.org/officeDocument/2006/relationships"}
-
-
-def _load_shared_strings(zf: zipfile.ZipFile) -> List[str]:
-    """Return the workbook shared strings table or an empty list if missing."""
-
-    try:
-        xml_data = zf.read("xl/sharedStrings.xml")
-    except KeyError:
-        return []
-
-    root = ET.fromstring(xml_data)
-    shared: List[str] = []
-    for si in root.findall("main:si", XML_NS):
-        text_parts = [t.text or "" for t in si.findall(".//main:t", XML_NS)]
-        shared.append("".join(text_parts))
-    return shared
-
-
-def _get_sheet_path(zf: zipfile.ZipFile, sheet_name: str) -> str:
-    """Resolve the worksheet path for the requested sheet name."""
-
-    workbook = ET.fromstring(zf.read("xl/workbook.xml"))
-    sheets_parent = workbook.find("main:sheets", XML_NS)
-    if sheets_parent is None:
-        raise ValueError("Workbook is missing sheets definition")
-
-    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
-    rel_map = {rel.attrib["Id"]: rel.attrib["Target"] for rel in rels}
-
-    for sheet in sheets_parent.findall("main:sheet", XML_NS):
-        if sheet.attrib.get("name") != sheet_name:
-            continue
-        rel_id = sheet.attrib.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id")
-        if not rel_id or rel_id not in rel_map:
-            break
-        target = rel_map[rel_id]
-        return f"xl/{target}"
-
-    raise ValueError(f"Sheet '{sheet_name}' not found")
-
-
-def _column_index(cell_ref: str) -> str:
-    return "".join(ch for ch in cell_ref if ch.isalpha())
+from .xlsx_stream import XML_NS, cached_shared_strings, get_sheet_path, iter_rows, load_shared_strings  # noqa: F401
 
 
 def _clean_text(value: Optional[str]) -> str:
@@ -66,40 +20,51 @@ def _clean_text(value: Optional[str]) -> str:
 def _split_lines(text: str):
     if not text:
         return ""
+    if "\n" not in text:
+        return text.strip()
     parts = [part.strip() for part in text.split("\n") if part.strip()]
     if len(parts) > 1:
         return parts
     return parts[0] if parts else ""
 
 
+_NUMERIC_START = frozenset("+-0123456789.")
+
+
 def _parse_numeric(text: str) -> Optional[float]:
+    # Labels such as "N/A" or "TBD" are common in D/E; turn them away before
+    # float() has to raise.
+    if not text or text[0] not in _NUMERIC_START:
+        return None
     try:
         return float(text)
-    except Exception:
+    except ValueError:
         return None
 
 
-def _iter_rows(zf: zipfile.ZipFile, sheet_path: str, shared: List[str]) -> Iterable[Dict[str, str]]:
-    sheet = ET.fromstring(zf.read(sheet_path))
-    for row in sheet.findall("main:sheetData/main:row", XML_NS):
-        values: Dict[str, str] = {}
-        for cell in row.findall("main:c", XML_NS):
-            ref = cell.attrib.get("r", "")
-            col = _column_index(ref)
-            cell_type = cell.attrib.get("t")
-            value_el = cell.find("main:v", XML_NS)
-            raw_value = value_el.text if value_el is not None else None
+# read_nwu_pa only looks at the KPA name and the six columns after it
+PA_COLUMNS = frozenset("ABCDEFG")
+_VALUE_COLUMNS = ("B", "C", "D", "E", "F", "G")
+_NUMERIC_COLUMNS = frozenset("DE")
 
-            if cell_type == "s":
-                resolved = shared[int(raw_value)] if raw_value is not None else ""
-            elif cell_type == "inlineStr":
-                inline = cell.find("main:is", XML_NS)
-                resolved = "".join(t_el.text or "" for t_el in inline.findall(".//main:t", XML_NS)) if inline is not None else ""
-            else:
-                resolved = raw_value or ""
 
-            values[col] = _clean_text(resolved)
-        yield values
+def _iter_rows(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    shared: Sequence[str],
+    wanted: Optional[FrozenSet[str]] = None,
+) -> Iterable[Dict[str, str]]:
+    # Cell text repeats heavily (shared strings, recurring numbers), so each
+    # distinct raw value is cleaned once per workbook.
+    cleaned: Dict[Optional[str], str] = {}
+    for _, values in iter_rows(zf, sheet_path, shared, wanted):
+        row: Dict[str, str] = {}
+        for col, value in values.items():
+            text = cleaned.get(value)
+            if text is None:
+                text = cleaned[value] = _clean_text(value)
+            row[col] = text
+        yield row
 
 
 def read_nwu_pa(path_to_xlsx) -> Dict[str, Dict[str, object]]:
@@ -119,30 +84,30 @@ def read_nwu_pa(path_to_xlsx) -> Dict[str, Dict[str, object]]:
         raise FileNotFoundError(path_to_xlsx)
 
     with zipfile.ZipFile(path) as zf:
-        shared_strings = _load_shared_strings(zf)
-        sheet_path = _get_sheet_path(zf, "pa-report")
+        shared_strings = cached_shared_strings(zf)
+        sheet_path = get_sheet_path(zf, "pa-report")
 
-        headers: List[str] = []
+        col_pairs: Tuple[Tuple[str, str], ...] = ()
         result: Dict[str, Dict[str, object]] = {}
 
-        for idx, row_values in enumerate(_iter_rows(zf, sheet_path, shared_strings), start=1):
+        for idx, row_values in enumerate(_iter_rows(zf, sheet_path, shared_strings, PA_COLUMNS), start=1):
             if idx == 1:
                 continue  # Title row
             if idx == 2:
-                headers = [row_values.get(col, "").strip() for col in ("A", "B", "C", "D", "E", "F", "G")]
+                headers = [row_values.get(col, "").strip() for col in _VALUE_COLUMNS]
+                col_pairs = tuple((col, header or col) for col, header in zip(_VALUE_COLUMNS, headers))
                 continue
 
-            kpa_name_raw = row_values.get("A", "")
-            kpa_name = _clean_text(kpa_name_raw)
+            # _iter_rows has already cleaned every value
+            kpa_name = row_values.get("A", "")
             if not kpa_name:
                 continue
 
             row_data: Dict[str, object] = {}
-            for col_letter, raw_value in zip(["B", "C", "D", "E", "F", "G"], headers[1:]):
-                header = raw_value or col_letter
-                cleaned = _clean_text(row_values.get(col_letter, ""))
+            for col_letter, header in col_pairs:
+                cleaned = row_values.get(col_letter, "")
                 value: object = _split_lines(cleaned)
-                if col_letter in {"D", "E"}:
+                if col_letter in _NUMERIC_COLUMNS:
                     numeric_value = _parse_numeric(cleaned)
                     if numeric_value is not None:
                         value = numeric_value
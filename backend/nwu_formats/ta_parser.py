@@ -1,17 +1,31 @@
-from __future__ import annotations
-
 """Parser for the NWU Task Agreement (TA) sheet."""
 
+from __future__ import annotations
+
+import functools
 import json
+import os
 import re
-from dataclasses import dataclass, asdict, field
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from .xlsx_stream import cached_shared_strings, find_sheet, iter_rows, read_core_properties
 
-from openpyxl import load_workbook  # type: ignore
+try:  # Addendum B summary (teaching modules, context buckets); optional
+    from backend.expectation_engine import parse_task_agreement as _parse_task_agreement  # type: ignore
+except Exception:  # pragma: no cover - keep TA parsing usable on its own
+    _parse_task_agreement = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceKPA:
     """KPA summary extracted from a Task Agreement."""
 
@@ -19,9 +33,9 @@ class PerformanceKPA:
     name: str
     hours: float
     weight_pct: float
-    outputs: List = None
-    kpis: List = None
-    outcomes: List = None
+    outputs: List = field(default_factory=list)
+    kpis: List = field(default_factory=list)
+    outcomes: List = field(default_factory=list)
     active: bool = True
     context: Dict[str, Any] | None = None
     source_sheet: str | None = None
@@ -30,12 +44,21 @@ class PerformanceKPA:
     validation_note: str | None = None
 
     def __post_init__(self) -> None:
+        # Callers may still pass None explicitly
         self.outputs = [] if self.outputs is None else self.outputs
         self.kpis = [] if self.kpis is None else self.kpis
         self.outcomes = [] if self.outcomes is None else self.outcomes
 
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow on purpose: asdict() deep-copies the context payloads only
+        # for the result to be serialised and thrown away.
+        return {name: getattr(self, name) for name in _KPA_FIELDS}
 
-@dataclass
+
+_KPA_FIELDS = tuple(f.name for f in fields(PerformanceKPA))
+
+
+@dataclass(slots=True)
 class PerformanceContract:
     """Lightweight performance contract derived from a TA."""
 
@@ -54,7 +77,7 @@ class PerformanceContract:
             "cycle_year": self.cycle_year,
             "total_weight_pct": self.total_weight_pct,
             "valid": self.valid,
-            "kpas": {code: asdict(kpa) for code, kpa in self.kpas.items()},
+            "kpas": {code: kpa.to_dict() for code, kpa in self.kpas.items()},
             "status": self.status,
             "validation_errors": list(self.validation_errors),
             "snapshot": self.snapshot,
@@ -72,41 +95,76 @@ SECTION_KPA_MAP: Dict[int, Tuple[str, str]] = {
 
 
 def _safe_float(value) -> float:
+    # Summary hours/weights are usually floats already
+    if isinstance(value, float):
+        return value
     try:
         return float(value)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return 0.0
 
 
+# Label in A, hours in D, weight in E
+_TA_COLUMNS = frozenset("ADE")
+
+_SECTION_RE = re.compile(r"section\s*(\d+)", re.IGNORECASE)
+_GRAND_TOTAL_RE = re.compile(r"grand\s*total\s*[:\-]?\s*section\s*(\d+)", re.IGNORECASE)
+
+
 def _extract_section_number(text: str) -> int | None:
-    match = re.search(r"section\s*(\d+)", str(text), re.IGNORECASE)
+    match = _SECTION_RE.search(str(text))
     if match:
         return int(match.group(1))
     return None
 
 
-def _detect_sheet(path_to_xlsx: str):
-    wb = load_workbook(filename=path_to_xlsx, data_only=True)
-    chosen = wb.sheetnames[0]
-    task_pattern = re.compile(r"task\s*agreement", re.IGNORECASE)
+# "Task Agreement", or any name mentioning both words
+_TASK_SHEET_RE = re.compile(r"task\s*agreement|^(?=.*task)(?=.*agreement)", re.IGNORECASE | re.DOTALL)
 
-    for sheet_name in wb.sheetnames:
-        if task_pattern.search(sheet_name):
-            chosen = sheet_name
-            break
-        if "task" in sheet_name.lower() and "agreement" in sheet_name.lower():
-            chosen = sheet_name
-            break
 
-    return wb[chosen], wb, chosen
+def _detect_sheet(zf: zipfile.ZipFile) -> Tuple[str, str]:
+    """Return ``(sheet name, worksheet path)`` of the Task Agreement sheet."""
+    return find_sheet(zf, _TASK_SHEET_RE)
 
 
-def _is_numeric(value: object) -> bool:
+def _cell_number(text: str | None):
+    """Numeric cells come back as raw ``<v>`` text; type them like openpyxl."""
+    if text is None:
+        return None
     try:
-        float(value)
-        return True
-    except Exception:
-        return False
+        return float(text) if any(ch in text for ch in ".eE") else int(text)
+    except ValueError:
+        return text
+
+
+def _cycle_year(created: str | None) -> str:
+    # dcterms:created is W3CDTF, e.g. 2024-08-27T11:37:08Z
+    if created and created[:4].isdigit():
+        return created[:4]
+    return "unknown_year"
+
+
+def _coerce_float(value: object) -> float | None:
+    """``float(value)``, or None when the cell does not hold a number."""
+    # _cell_number has already typed ordinary numeric cells
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# Summary buckets copied into each KPA's context
+_SUMMARY_CATEGORIES: Dict[str, Tuple[str, ...]] = {
+    "KPA1": ("teaching", "supervision", "teaching_practice_windows"),
+    "KPA2": ("ohs",),
+    "KPA3": ("research",),
+    "KPA4": ("leadership",),
+    "KPA5": ("social",),
+}
 
 
 def _build_kpa_context_from_summary(summary: Dict[str, Any], kpa_code: str) -> Dict[str, Any]:
@@ -114,22 +172,16 @@ def _build_kpa_context_from_summary(summary: Dict[str, Any], kpa_code: str) -> D
 
     context: Dict[str, Any] = {}
     kpa_summary = summary.get("kpa_summary", {}) or {}
-    if kpa_code in kpa_summary and isinstance(kpa_summary[kpa_code], dict):
-        context.update(kpa_summary[kpa_code])
+    # Guarded rather than assumed: update() would also accept a list of pairs
+    block = kpa_summary.get(kpa_code)
+    if isinstance(block, dict):
+        context.update(block)
 
     norm_hours = summary.get("norm_hours")
     if norm_hours:
         context.setdefault("norm_hours", norm_hours)
 
-    category_map: Dict[str, List[str]] = {
-        "KPA1": ["teaching", "supervision", "teaching_practice_windows"],
-        "KPA2": ["ohs"],
-        "KPA3": ["research"],
-        "KPA4": ["leadership"],
-        "KPA5": ["social"],
-    }
-
-    for key in category_map.get(kpa_code, []):
+    for key in _SUMMARY_CATEGORIES.get(kpa_code, ()):
         value = summary.get(key)
         if value:
             context[key] = value
@@ -150,22 +202,18 @@ def _fold_people_management_summary(summary: Dict[str, Any], director_level: boo
 
     merged_summary = dict(summary or {})
     kpa_summary = dict(merged_summary.get("kpa_summary") or {})
-    people_management = merged_summary.get("people_management")
-
     pm_block = kpa_summary.pop("KPA6", None)
     if pm_block:
-        kpa4 = dict(kpa_summary.get("KPA4") or {})
-        kpa4_hours = _safe_float(kpa4.get("hours")) + _safe_float(pm_block.get("hours"))
-        kpa4_weight = _safe_float(kpa4.get("weight_pct")) + _safe_float(pm_block.get("weight_pct"))
-        if not kpa4.get("name"):
-            kpa4["name"] = pm_block.get("name", "Academic Leadership and Management")
-        kpa4["hours"] = kpa4_hours
-        kpa4["weight_pct"] = kpa4_weight
-        kpa_summary["KPA4"] = kpa4
+        kpa4 = kpa_summary.get("KPA4") or {}
+        # One new dict for KPA4; the summary's own block is left untouched
+        kpa_summary["KPA4"] = {
+            **kpa4,
+            "name": kpa4.get("name") or pm_block.get("name", "Academic Leadership and Management"),
+            "hours": _safe_float(kpa4.get("hours")) + _safe_float(pm_block.get("hours")),
+            "weight_pct": _safe_float(kpa4.get("weight_pct")) + _safe_float(pm_block.get("weight_pct")),
+        }
 
     merged_summary["kpa_summary"] = kpa_summary
-    if people_management:
-        merged_summary["people_management"] = people_management
     return merged_summary
 
 
@@ -176,11 +224,16 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
     section_totals: List[Dict[str, Any]] = []
     kpas: Dict[str, PerformanceKPA] = {}
     sheet_name = "unknown"
-    wb = None
 
+    zf: zipfile.ZipFile | None = None
     try:
-        ws, wb, sheet_name = _detect_sheet(path_to_xlsx)
+        zf = zipfile.ZipFile(path_to_xlsx)
+        sheet_name, sheet_path = _detect_sheet(zf)
     except Exception as exc:
+        # A readable archive with a bad workbook must not stay open (and,
+        # on Windows, locked)
+        if zf is not None:
+            zf.close()
         contract = PerformanceContract(
             staff_id="unknown_staff",
             cycle_year="unknown_year",
@@ -193,45 +246,55 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
         _save_snapshot(contract)
         return contract
 
+    # Workbook properties are read up front, before the rows are streamed
     try:
-        total_pattern = re.compile(
-            r"grand\s*total\s*[:\-]?\s*section\s*(\d+)", re.IGNORECASE
-        )
+        properties = read_core_properties(zf)
+    except Exception:
+        properties = {}
+    staff_id = properties.get("creator") or "unknown_staff"
+    cycle_year = _cycle_year(properties.get("created"))
 
-        for idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
-            if not row or not row[0]:
+    try:
+        search_total = _GRAND_TOTAL_RE.search
+
+        # Only column A is inspected on most rows; D/E are read for the
+        # handful of grand-total rows.
+        for idx, row in iter_rows(zf, sheet_path, cached_shared_strings(zf), _TA_COLUMNS):
+            # Nearly every label lacks "total"; a substring test on the raw
+            # text is far cheaper than stripping it and running the regex
+            raw_label = row.get("A")
+            if not raw_label or "total" not in raw_label.lower():
                 continue
-            label = str(row[0]).strip()
-            m = total_pattern.search(label)
+            label = raw_label.strip()
+            m = search_total(label)
             if not m:
                 continue
 
-            section_num = _extract_section_number(label) or _safe_float(m.group(1))
+            # The grand-total match already captured the section number
+            section_num = int(m.group(1))
             if not section_num:
                 validation_errors.append(f"Row {idx}: could not detect section number")
                 continue
-            section_num = int(section_num)
 
             mapping = SECTION_KPA_MAP.get(section_num)
             if mapping is None:
                 validation_errors.append(f"Row {idx}: unknown section {section_num}")
                 continue
 
-            if len(row) <= 4:
+            if "D" not in row and "E" not in row:
                 validation_errors.append(f"Row {idx}: missing hours/weight columns D/E")
                 continue
 
-            hours_raw = row[3]
-            weight_raw = row[4] if len(row) > 4 else None
-            if not _is_numeric(hours_raw) or not _is_numeric(weight_raw):
+            hours_raw = _cell_number(row.get("D"))
+            weight_raw = _cell_number(row.get("E"))
+            hours = _coerce_float(hours_raw)
+            weight_pct = _coerce_float(weight_raw)
+            if hours is None or weight_pct is None:
                 validation_errors.append(
                     f"Row {idx}: non-numeric hours/weight in columns D/E"
                 )
                 continue
 
-            hours = _safe_float(hours_raw)
-            weight_pct = _safe_float(weight_raw)
-
             code, name = mapping
             kpa = PerformanceKPA(
                 code=code,
@@ -259,33 +322,40 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
             }
             snapshot_rows.append(row_data)
             section_totals.append(row_data)
+            # Stop once every section has a total. There is no "N rows since
+            # the last match" cut-off: the Section 1 and 2 totals sit ~250
+            # rows apart on real FEDU forms, below the teaching-module block.
+            if len(kpas) == len(SECTION_KPA_MAP):
+                break
 
         # Attach teaching modules from Addendum B if available
         modules: List[str] = []
         summary: Dict[str, Any] = {}
-        try:
-            from backend.expectation_engine import parse_task_agreement  # type: ignore
-
-            summary = _fold_people_management_summary(
-                parse_task_agreement(path_to_xlsx, director_level=director_level),
-                director_level,
-            )
-            modules = summary.get("teaching_modules") or []
-        except Exception:
-            modules = []
-            summary = {}
+        if _parse_task_agreement is not None:
+            try:
+                summary = _fold_people_management_summary(
+                    # Reuse the open archive rather than reopening the file
+                    _parse_task_agreement(path_to_xlsx, director_level=director_level, workbook=zf),
+                    director_level,
+                )
+                modules = summary.get("teaching_modules") or []
+            except Exception:
+                modules = []
+                summary = {}
     except Exception as exc:
         validation_errors.append(f"Unexpected parsing error: {exc}")
         modules = []
         summary = {}
+    finally:
+        zf.close()
 
     if not section_totals:
         validation_errors.append("No GRAND TOTAL section rows found in sheet")
 
+    # Every KPA above is built with its own context dict, so the blocks below
+    # update it in place
     if modules and "KPA2" in kpas:
-        kpa2 = kpas["KPA2"]
-        kpa2.context = kpa2.context or {}
-        kpa2.context["modules"] = modules
+        kpas["KPA2"].context["modules"] = modules
 
     if not director_level and "KPA6" in kpas:
         pm_kpa = kpas.pop("KPA6")
@@ -293,14 +363,9 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
         if target:
             target.hours = (target.hours or 0.0) + (pm_kpa.hours or 0.0)
             target.weight_pct = (target.weight_pct or 0.0) + (pm_kpa.weight_pct or 0.0)
-            pm_context_raw = getattr(pm_kpa, "context", {}) or {}
-            pm_context = pm_context_raw if isinstance(pm_context_raw, dict) else {}
-            if pm_context:
-                combined_ctx = dict(pm_context)
-                target_context_raw = getattr(target, "context", {}) or {}
-                if isinstance(target_context_raw, dict):
-                    combined_ctx.update(target_context_raw)
-                target.context = combined_ctx
+            if pm_kpa.context:
+                # KPA4's own entries win over People Management's
+                target.context = {**pm_kpa.context, **target.context}
         else:
             kpas["KPA4"] = pm_kpa
             pm_kpa.code = "KPA4"
@@ -309,10 +374,7 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
     # Attach TA context buckets when available
     if summary:
         for code, kpa in kpas.items():
-            context = getattr(kpa, "context", {}) or {}
-            merged = dict(context)
-            merged.update(_build_kpa_context_from_summary(summary, code))
-            kpa.context = merged
+            kpa.context.update(_build_kpa_context_from_summary(summary, code))
 
     total_weight = sum(kpa.weight_pct for kpa in kpas.values())
     total_hours = sum(kpa.hours for kpa in kpas.values()) if kpas else 0.0
@@ -323,16 +385,6 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
     is_valid = bool(kpas) and abs(total_weight - 100.0) < 0.5 and not validation_errors
     status = "OK" if is_valid else "INVALID_TA"
 
-    # Fallback metadata if we cannot read it from the workbook properties
-    try:
-        staff_id = getattr(wb.properties, "creator", None) or "unknown_staff"
-        created = getattr(wb.properties, "created", None)
-        cycle_year = created.year if created else None
-    except Exception:
-        staff_id = "unknown_staff"
-        cycle_year = None
-    cycle_year = str(cycle_year) if cycle_year else "unknown_year"
-
     contract = PerformanceContract(
         staff_id=str(staff_id),
         cycle_year=cycle_year,
@@ -357,9 +409,35 @@ def parse_nwu_ta(path_to_xlsx: str, director_level: bool = False) -> Performance
     return contract
 
 
+def parse_nwu_ta_batch(
+    paths: Iterable[str],
+    director_level: bool = False,
+    max_workers: int | None = None,
+) -> List[PerformanceContract]:
+    """Parse several Task Agreements in worker processes, keeping input order.
+
+    Inflating and parsing each workbook is CPU-bound, so threads would
+    serialise on the GIL. A single path is parsed in-process.
+    """
+    paths = [str(p) for p in paths]
+    parse = functools.partial(parse_nwu_ta, director_level=director_level)
+    if len(paths) <= 1 or max_workers == 1:
+        return [parse(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(parse, paths))
+
+
+_SNAPSHOT_DIR = Path(__file__).resolve().parents[1] / "data" / "contracts"
+# Set once the directory has been created, so batch ingests skip the mkdir
+_snapshot_dir_ready = False
+
+
 def _save_snapshot(contract: PerformanceContract) -> Path:
-    base_dir = Path(__file__).resolve().parents[1] / "data" / "contracts"
-    base_dir.mkdir(parents=True, exist_ok=True)
+    global _snapshot_dir_ready
+    base_dir = _SNAPSHOT_DIR
+    if not _snapshot_dir_ready:
+        base_dir.mkdir(parents=True, exist_ok=True)
+        _snapshot_dir_ready = True
 
     safe_staff = (
         str(contract.staff_id).replace("/", "-").replace("\\", "-") or "unknown_staff"
@@ -367,5 +445,25 @@ def _save_snapshot(contract: PerformanceContract) -> Path:
     safe_year = str(contract.cycle_year) or "unknown_year"
     out_path = base_dir / f"{safe_staff}_{safe_year}_TA.json"
 
-    out_path.write_text(json.dumps(contract.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+    payload = contract.to_dict()
+    # Written beside the target and renamed into place, so a reader (the GUI,
+    # or another worker of parse_nwu_ta_batch) never sees a half-written file
+    tmp_path = out_path.with_name(f"{out_path.name}.{os.getpid()}.tmp")
+    try:
+        data = None
+        if orjson is not None:
+            try:
+                # ta_parse_report is keyed by section number
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the json module copes
+        if data is not None:
+            tmp_path.write_bytes(data)
+        else:
+            with tmp_path.open("w", encoding="utf-8") as fh:
+                json.dump(payload, fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return out_path
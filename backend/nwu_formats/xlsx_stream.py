@@ -0,0 +1,241 @@
+"""Streaming helpers for reading .xlsx workbooks without openpyxl.
+
+The NWU parsers only need a handful of rows from one sheet, so they read the
+worksheet XML straight out of the zip archive and walk it row by row.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+
+XML_NS = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+          "rel": "http://schemas.openxmlformats.org/officeDocument/2006/relationships"}
+
+CORE_NS = {"dc": "http://purl.org/dc/elements/1.1/",
+           "dcterms": "http://purl.org/dc/terms/"}
+
+# Shared strings shorter than this are interned
+INTERN_MAX_LEN = 128
+
+# sharedStrings.xml entries at least this large (uncompressed) are streamed;
+# below it one read + fromstring is faster than iterparse's event overhead.
+SHARED_STREAM_MIN_BYTES = 1 << 20
+
+# Workbooks whose shared strings are kept between parses
+SHARED_CACHE_SIZE = 32
+
+# Clark-notation tags. ``find``/``findall`` with a plain qualified tag stay in
+# the C accelerator; "main:v" plus a namespace map detours through the
+# pure-Python ElementPath module on every call (~18x slower per cell).
+_MAIN = "{%s}" % XML_NS["main"]
+_ROW_TAG = _MAIN + "row"
+_SHEET_DATA_TAG = _MAIN + "sheetData"
+_C_TAG = _MAIN + "c"
+_V_TAG = _MAIN + "v"
+_IS_TAG = _MAIN + "is"
+_T_TAG = _MAIN + "t"
+_SI_TAG = _MAIN + "si"
+_SHEETS_TAG = _MAIN + "sheets"
+_SHEET_TAG = _MAIN + "sheet"
+_REL_ID = "{%s}id" % XML_NS["rel"]
+_CREATOR_TAG = "{%s}creator" % CORE_NS["dc"]
+_CREATED_TAG = "{%s}created" % CORE_NS["dcterms"]
+
+try:
+    import _elementtree  # noqa: F401
+    C_ACCELERATED = ET.XMLParser is _elementtree.XMLParser
+except ImportError:  # pragma: no cover - CPython always ships the accelerator
+    C_ACCELERATED = False
+
+
+def _shared_text(si: ET.Element) -> str:
+    text = "".join(t.text or "" for t in si.iter(_T_TAG))
+    # Short labels repeat across many cells and end up as dict keys and
+    # comparison operands; long free text is left alone.
+    return sys.intern(text) if len(text) < INTERN_MAX_LEN else text
+
+
+def load_shared_strings(zf: zipfile.ZipFile) -> List[str]:
+    """Return the workbook shared strings table or an empty list if missing."""
+
+    try:
+        info = zf.getinfo("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+
+    if info.file_size < SHARED_STREAM_MIN_BYTES:
+        root = ET.fromstring(zf.read(info))
+        return [_shared_text(si) for si in root.findall(_SI_TAG)]
+
+    # Large tables are decompressed in chunks straight into the parser and
+    # each <si> is dropped once read, like the worksheet rows in iter_rows.
+    shared: List[str] = []
+    with zf.open(info) as source:
+        for _, elem in ET.iterparse(source):
+            if elem.tag == _SI_TAG:
+                shared.append(_shared_text(elem))
+                elem.clear()
+    return shared
+
+
+# (path, inode, mtime_ns, size) -> shared strings; tuples so callers cannot
+# mutate a cached table
+_SHARED_CACHE: "OrderedDict[Tuple[str, int, int, int], Tuple[str, ...]]" = OrderedDict()
+
+
+def cached_shared_strings(zf: zipfile.ZipFile) -> Sequence[str]:
+    """Shared strings for ``zf``, reused while the file on disk is unchanged.
+
+    The same workbook is typically parsed several times (validation, snapshot
+    regeneration, previews). The key comes from ``fstat`` on the archive's
+    open handle, so it always describes the bytes actually being read.
+    Archives not backed by a real file are loaded without caching.
+    """
+
+    try:
+        st = os.fstat(zf.fp.fileno())
+    except (AttributeError, OSError, ValueError):
+        return load_shared_strings(zf)
+
+    key = (os.path.abspath(zf.filename or ""), st.st_ino, st.st_mtime_ns, st.st_size)
+    shared = _SHARED_CACHE.get(key)
+    if shared is None:
+        shared = _SHARED_CACHE[key] = tuple(load_shared_strings(zf))
+        if len(_SHARED_CACHE) > SHARED_CACHE_SIZE:
+            _SHARED_CACHE.popitem(last=False)
+    else:
+        _SHARED_CACHE.move_to_end(key)
+    return shared
+
+
+def list_sheets(zf: zipfile.ZipFile) -> List[Tuple[str, str]]:
+    """Return ``(sheet name, worksheet path)`` pairs in workbook order."""
+
+    workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+    sheets_parent = workbook.find(_SHEETS_TAG)
+    if sheets_parent is None:
+        raise ValueError("Workbook is missing sheets definition")
+
+    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    rel_map = {rel.attrib["Id"]: rel.attrib["Target"] for rel in rels}
+
+    sheets: List[Tuple[str, str]] = []
+    for sheet in sheets_parent.findall(_SHEET_TAG):
+        rel_id = sheet.get(_REL_ID)
+        if not rel_id or rel_id not in rel_map:
+            continue
+        target = rel_map[rel_id].lstrip("/")
+        path = target if target.startswith("xl/") else f"xl/{target}"
+        sheets.append((sheet.get("name", ""), path))
+    return sheets
+
+
+def get_sheet_path(zf: zipfile.ZipFile, sheet_name: str) -> str:
+    """Resolve the worksheet path for the requested sheet name."""
+
+    for name, path in list_sheets(zf):
+        if name == sheet_name:
+            return path
+    raise ValueError(f"Sheet '{sheet_name}' not found")
+
+
+def read_core_properties(zf: zipfile.ZipFile) -> Dict[str, Optional[str]]:
+    """Return ``creator`` and ``created`` from ``docProps/core.xml``."""
+
+    try:
+        core = ET.fromstring(zf.read("docProps/core.xml"))
+    except (KeyError, ET.ParseError):
+        return {"creator": None, "created": None}
+
+    def _text(tag: str) -> Optional[str]:
+        el = core.find(tag)
+        return el.text.strip() if el is not None and el.text else None
+
+    return {"creator": _text(_CREATOR_TAG), "created": _text(_CREATED_TAG)}
+
+
+_DIGITS = "0123456789"
+_COLUMN_CACHE_MAX = 16384
+_column_cache: Dict[str, str] = {}
+
+
+def column_letters(cell_ref: str) -> str:
+    """Column part of an ``A1``-style reference (``"AB12"`` -> ``"AB"``)."""
+    col = _column_cache.get(cell_ref)
+    if col is None:
+        if len(_column_cache) >= _COLUMN_CACHE_MAX:
+            _column_cache.clear()
+        # Interned so row dicts share one key object per column
+        col = _column_cache[cell_ref] = sys.intern(cell_ref.rstrip(_DIGITS))
+    return col
+
+
+def _cell_value(cell: ET.Element, shared: Sequence[str]) -> Optional[str]:
+    cell_type = cell.get("t")
+    value_el = cell.find(_V_TAG)
+    raw_value = value_el.text if value_el is not None else None
+
+    if cell_type == "s":
+        return shared[int(raw_value)] if raw_value is not None else ""
+    if cell_type == "inlineStr":
+        inline = cell.find(_IS_TAG)
+        return "".join(t_el.text or "" for t_el in inline.iter(_T_TAG)) if inline is not None else ""
+    return raw_value
+
+
+def iter_rows(
+    zf: zipfile.ZipFile,
+    sheet_path: str,
+    shared: Sequence[str],
+    wanted: Optional[FrozenSet[str]] = None,
+) -> Iterator[Tuple[int, Dict[str, Optional[str]]]]:
+    """Yield ``(row number, {column letter: text})`` for each stored row.
+
+    Shared and inline strings are resolved; other cells keep their raw ``<v>``
+    text. When ``wanted`` is given, cells in other columns are skipped before
+    their values are resolved. The sheet is parsed incrementally from the
+    archive stream and each row is cleared and detached once it has been
+    yielded.
+    """
+
+    with zf.open(sheet_path) as source:
+        row_number = 0
+        sheet_data = None
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if elem.tag == _SHEET_DATA_TAG:
+                    sheet_data = elem
+                continue
+            if elem.tag != _ROW_TAG:
+                continue
+            row_number = int(elem.attrib.get("r", row_number + 1))
+            values: Dict[str, Optional[str]] = {}
+            for cell in elem.findall(_C_TAG):
+                col = column_letters(cell.get("r", ""))
+                if wanted is not None and col not in wanted:
+                    continue
+                values[col] = _cell_value(cell, shared)
+            yield row_number, values
+            # Detach the finished row so memory stays bounded by one row
+            elem.clear()
+            if sheet_data is not None:
+                sheet_data.remove(elem)
+
+
+def find_sheet(zf: zipfile.ZipFile, pattern: "re.Pattern[str]") -> Tuple[str, str]:
+    """Return the first sheet whose name matches ``pattern``, else the first sheet."""
+
+    sheets = list_sheets(zf)
+    if not sheets:
+        raise ValueError("Workbook has no worksheets")
+    for name, path in sheets:
+        if pattern.search(name):
+            return name, path
+    return sheets[0]
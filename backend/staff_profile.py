@@ -1,9 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 import json
+import os
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 # This file lives in: backend/staff_profile.py
 # So parents[0] == backend/
@@ -11,8 +17,11 @@ BASE_DIR = Path(__file__).resolve().parents[0]
 CONTRACT_DIR = BASE_DIR / "data" / "contracts"
 CONTRACT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Contract directories already created in this process
+_READY_DIRS = {CONTRACT_DIR}
+
 
-@dataclass
+@dataclass(slots=True)
 class KPI:
     """
     KPI under a KPA in the performance contract.
@@ -30,8 +39,14 @@ class KPI:
     hours: Optional[float] = None
     active: bool = True
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in _KPI_FIELDS}
 
-@dataclass
+
+_KPI_FIELDS = tuple(f.name for f in fields(KPI))
+
+
+@dataclass(slots=True)
 class KPA:
     """
     Key Performance Area – aligned with NWU KPA codes.
@@ -44,8 +59,19 @@ class KPA:
     context: Dict[str, Any] = field(default_factory=dict)
     ta_context: Dict[str, Any] = field(default_factory=dict)
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "code": self.code,
+            "name": self.name,
+            "weight": self.weight,
+            "hours": self.hours,
+            "kpis": [kpi.to_dict() for kpi in self.kpis],
+            "context": self.context,
+            "ta_context": self.ta_context,
+        }
+
+
+@dataclass(slots=True)
 class StaffProfile:
     """
     A staff member's performance contract for a single year.
@@ -69,7 +95,18 @@ class StaffProfile:
         return CONTRACT_DIR / filename
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand: asdict() deep-copies every context payload only for
+        # the result to be dumped to JSON straight away.
+        return {
+            "staff_id": self.staff_id,
+            "name": self.name,
+            "position": self.position,
+            "cycle_year": self.cycle_year,
+            "faculty": self.faculty,
+            "line_manager": self.line_manager,
+            "kpas": [kpa.to_dict() for kpa in self.kpas],
+            "flags": list(self.flags),
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StaffProfile":
@@ -78,6 +115,9 @@ class StaffProfile:
         kpas: List[KPA] = []
         for k in kpas_raw:
             kpis_raw = k.get("kpis", [])
+            # KPI(**kp) is deliberate: unpacking a dict is the cheapest way to
+            # call the dataclass __init__, missing keys keep their defaults,
+            # and unknown keys still fail loudly.
             kpis = [KPI(**kp) for kp in kpis_raw]
             kpa = KPA(
                 code=k.get("code", ""),
@@ -105,9 +145,32 @@ class StaffProfile:
         """
         Persist this contract to JSON.
         """
-        self.contract_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.contract_path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        parent = self.contract_path.parent
+        if parent not in _READY_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _READY_DIRS.add(parent)
+        payload = self.to_dict()
+        data = None
+        if orjson is not None:
+            try:
+                # TA context payloads can carry int keys (section numbers)
+                data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the json module copes
+        # Write beside the target and swap it in, so a failed save never
+        # leaves a truncated contract behind.
+        path = self.contract_path
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            if data is not None:
+                tmp_path.write_bytes(data)
+            else:
+                with tmp_path.open("w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
 
 # ---------------------------------------------------------------------------
@@ -128,10 +191,9 @@ def _default_kpas() -> List[KPA]:
     Default empty KPA skeletons so the GUI and PA generator always
     have the 5 core NWU KPAs present.
     """
-    return [
-        KPA(code=code, name=name, weight=None, hours=None, kpis=[], ta_context={})
-        for code, name in DEFAULT_KPAS
-    ]
+    # weight/hours/kpis/contexts are the dataclass defaults; each KPA still
+    # gets its own fresh lists and dicts from the default factories
+    return [KPA(code, name) for code, name in DEFAULT_KPAS]
 
 
 def create_or_load_profile(
@@ -7,6 +7,7 @@ vamp_agent.py — Enhanced Playwright agent with Outlook Office365 authenticatio
 from __future__ import annotations
 
 import asyncio
+import atexit
 import datetime as dt
 import hashlib
 from collections import OrderedDict
@@ -18,11 +19,10 @@ import os
 import platform
 import re
 import tempfile
-import time
 import shutil
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urlparse
 from textwrap import dedent
 
@@ -43,20 +43,14 @@ else:
 
 from email.utils import parsedate_to_datetime
 
-OCR_AVAILABLE = False
+# None until _ocr_available() has probed the tesseract binary
+OCR_AVAILABLE: Optional[bool] = None
 _OCR_ERROR: Optional[str] = None
 _OCR_STATUS_LOGGED = False
 
 try:
     from PIL import Image  # type: ignore
     import pytesseract  # type: ignore
-
-    try:
-        pytesseract.get_tesseract_version()
-        OCR_AVAILABLE = True
-    except Exception as exc:  # pragma: no cover - environment dependent
-        OCR_AVAILABLE = False
-        _OCR_ERROR = str(exc)
 except Exception as exc:  # pragma: no cover - optional dependency
     Image = None  # type: ignore
     pytesseract = None  # type: ignore
@@ -144,13 +138,23 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # Keep a single shared browser across scans
 _PLAYWRIGHT = None
 _BROWSER = None
+# Visible browser for interactive logins, only launched when _BROWSER is headless
+_HEADFUL_BROWSER = None
+# Loop owned by refresh_storage_state_sync; kept open between calls
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
 _CTX = None
 _PAGES: Dict[str, Any] = {}
 _SERVICE_CONTEXTS: "OrderedDict[str, Any]" = OrderedDict()
 _CONTEXT_LOCK = asyncio.Lock()
+_CONTEXT_KEY_LOCKS: Dict[str, asyncio.Lock] = {}
 _BROWSER_LOCK = asyncio.Lock()
 _MAX_CONTEXTS = 10
 
+# Evidence snippets keep this many characters; only a bounded prefix of the
+# source text is whitespace-collapsed to produce them
+_SNIPPET_CHARS = 400
+_SNIPPET_SCAN_CHARS = 4096
+
 PLATFORM_LABELS = {
     "outlook": "Outlook",
     "onedrive": "OneDrive",
@@ -250,6 +254,44 @@ async def ensure_browser() -> None:
             ) from exc
 
 
+async def _interactive_browser() -> Any:
+    """Return a visible browser for manual sign-in; call after ensure_browser()."""
+    global _HEADFUL_BROWSER
+    if not BROWSER_CONFIG.get("headless", True):
+        # The shared browser is already on screen; a fresh context isolates the login
+        return _BROWSER
+
+    async with _BROWSER_LOCK:
+        if _HEADFUL_BROWSER is None or not _HEADFUL_BROWSER.is_connected():
+            _HEADFUL_BROWSER = await _PLAYWRIGHT.chromium.launch(
+                headless=False,
+                args=BROWSER_CONFIG.get("args", []),
+            )
+        return _HEADFUL_BROWSER
+
+
+async def shutdown_browser() -> None:
+    """Close cached contexts and every cached browser, then stop Playwright."""
+    global _PLAYWRIGHT, _BROWSER, _HEADFUL_BROWSER
+    async with _BROWSER_LOCK:
+        contexts = list(_SERVICE_CONTEXTS.values())
+        _SERVICE_CONTEXTS.clear()
+        browsers = [b for b in (_HEADFUL_BROWSER, _BROWSER) if b is not None]
+        playwright, _PLAYWRIGHT = _PLAYWRIGHT, None
+        _BROWSER = _HEADFUL_BROWSER = None
+
+        for closable in (*contexts, *browsers):
+            try:
+                await closable.close()
+            except Exception:
+                pass
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+
 def _base_context_kwargs() -> Dict[str, Any]:
     return {
         'viewport': {'width': 1280, 'height': 800},
@@ -265,6 +307,10 @@ def _base_context_kwargs() -> Dict[str, Any]:
     }
 
 
+# Per-service state directories already created in this process
+_READY_STATE_DIRS: Set[Path] = set()
+
+
 def _state_path_for(service: Optional[str], identity: Optional[str]) -> Optional[Path]:
     if not service:
         return None
@@ -273,7 +319,9 @@ def _state_path_for(service: Optional[str], identity: Optional[str]) -> Optional
     if not base:
         return None
 
-    base.mkdir(parents=True, exist_ok=True)
+    if base not in _READY_STATE_DIRS:
+        base.mkdir(parents=True, exist_ok=True)
+        _READY_STATE_DIRS.add(base)
 
     safe_identity = _uid(identity) if identity else "default"
     state_path = base / f"{safe_identity}.json"
@@ -281,9 +329,9 @@ def _state_path_for(service: Optional[str], identity: Optional[str]) -> Optional
     # Migrate legacy single-state files if present
     legacy = LEGACY_STATE_PATHS.get(service)
     if legacy and legacy.exists() and not state_path.exists():
+        # Copied, not renamed: every identity without its own state file
+        # is seeded from the same legacy file.
         try:
-            import shutil
-
             shutil.copy2(legacy, state_path)
             logger.info("Migrated legacy %s storage state from %s", service, legacy)
         except Exception as exc:
@@ -292,6 +340,32 @@ def _state_path_for(service: Optional[str], identity: Optional[str]) -> Optional
     return state_path
 
 
+def _write_state_file(state_path: Path, state: Any) -> None:
+    """Write ``state`` as JSON via a temp file renamed into place."""
+    fd, tmp = tempfile.mkstemp(dir=state_path.parent, prefix=f"{state_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(state, fh, separators=(",", ":"))
+        os.replace(tmp, state_path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+async def _save_storage_state(context: Any, state_path: Path) -> None:
+    """Save a context's cookies/localStorage without blocking the event loop.
+
+    ``storage_state(path=...)`` encodes and writes the file on the loop
+    thread; a crash mid-write also leaves a truncated file that breaks the
+    next ``new_context``. Here only the fetch is awaited on the loop.
+    """
+    state = await context.storage_state()
+    await asyncio.to_thread(_write_state_file, state_path, state)
+
+
 async def _persist_context_state(service: Optional[str], identity: Optional[str], context: Any) -> None:
     """Persist the latest browser storage state for a given service."""
 
@@ -300,12 +374,31 @@ async def _persist_context_state(service: Optional[str], identity: Optional[str]
         return
 
     try:
-        state_path.parent.mkdir(parents=True, exist_ok=True)
-        await context.storage_state(path=str(state_path))
+        await _save_storage_state(context, state_path)
     except Exception as exc:
         logger.debug("Unable to persist %s storage state: %s", service or "generic", exc)
 
 
+def _reuse_cached_context(key: str, service: str, identity: Optional[str]) -> Any:
+    """Return the cached context for ``key`` if still open, else drop it."""
+    existing = _SERVICE_CONTEXTS.get(key)
+    if existing is None:
+        return None
+    try:
+        if not existing.is_closed():
+            logger.info(
+                "Reusing cached %s context with saved state for %s",
+                service or "generic",
+                identity or "default",
+            )
+            _SERVICE_CONTEXTS.move_to_end(key)
+            return existing
+    except Exception:
+        pass
+    _SERVICE_CONTEXTS.pop(key, None)
+    return None
+
+
 async def get_authenticated_context(service: str, identity: Optional[str] = None) -> Any:
     """Get or create an authenticated context using storage state."""
     await ensure_browser()
@@ -314,20 +407,19 @@ async def get_authenticated_context(service: str, identity: Optional[str] = None
     key = f"{service}:{identity_key}" if service else f"generic:{identity_key}"
 
     async with _CONTEXT_LOCK:
-        existing = _SERVICE_CONTEXTS.get(key)
+        existing = _reuse_cached_context(key, service, identity)
         if existing is not None:
-            try:
-                if not existing.is_closed():
-                    logger.info(
-                        "Reusing cached %s context with saved state for %s",
-                        service or "generic",
-                        identity or "default",
-                    )
-                    _SERVICE_CONTEXTS.move_to_end(key)
-                    return existing
-            except Exception:
-                pass
-            _SERVICE_CONTEXTS.pop(key, None)
+            return existing
+        key_lock = _CONTEXT_KEY_LOCKS.setdefault(key, asyncio.Lock())
+
+    # Building a context can wait minutes on a manual login, so only callers
+    # for the same service/identity queue behind it; _CONTEXT_LOCK itself is
+    # held just for the cache bookkeeping.
+    async with key_lock:
+        async with _CONTEXT_LOCK:
+            existing = _reuse_cached_context(key, service, identity)
+        if existing is not None:
+            return existing
 
         state_path = _state_path_for(service, identity)
         context_kwargs = _base_context_kwargs()
@@ -370,16 +462,17 @@ async def get_authenticated_context(service: str, identity: Optional[str] = None
                     f"Manual login for {service} did not persist credentials to {state_path}."
                 )
 
-            # Reload the context with the freshly captured storage state
-            await context.close()
-            context_kwargs['storage_state'] = str(state_path)
-            context = await _BROWSER.new_context(**context_kwargs)
+            # Keep the context the user just signed in with: its cookie jar is
+            # exactly what was written to state_path, so closing it and
+            # reopening from that file would only repeat the setup.
 
         await apply_stealth(context)
-        _SERVICE_CONTEXTS[key] = context
-        _SERVICE_CONTEXTS.move_to_end(key)
-        if len(_SERVICE_CONTEXTS) > _MAX_CONTEXTS:
-            evicted_key, evicted_context = _SERVICE_CONTEXTS.popitem(last=False)
+        async with _CONTEXT_LOCK:
+            _SERVICE_CONTEXTS[key] = context
+            _SERVICE_CONTEXTS.move_to_end(key)
+            evicted = _SERVICE_CONTEXTS.popitem(last=False) if len(_SERVICE_CONTEXTS) > _MAX_CONTEXTS else None
+        if evicted is not None:
+            evicted_key, evicted_context = evicted
             try:
                 await evicted_context.close()
             except Exception:
@@ -451,42 +544,40 @@ async def _dismiss_kmsi_prompt(page: Any) -> None:
         pass
 
 
+def _any_selector(page: Any, selectors: Sequence[str]) -> Any:
+    """Locator for the first element matching any of ``selectors``.
+
+    The candidates are joined with ``Locator.or_`` so one wait covers them
+    all, rather than a separate timeout per candidate that never appears.
+    Playwright releases before 1.33 have no ``or_``; there the candidates
+    are joined into one comma-separated CSS selector list instead.
+    """
+    locator = page.locator(selectors[0])
+    if not hasattr(locator, "or_"):
+        return page.locator(", ".join(selectors)).first
+    for selector in selectors[1:]:
+        locator = locator.or_(page.locator(selector))
+    return locator.first
+
+
 async def _try_nwu_adfs_login(page: Any, username: str, password: str) -> bool:
     """Attempt to authenticate against the NWU ADFS portal if detected."""
 
-    selectors = [
-        '#userNameInput',
-        'input[name="UserName"]',
-    ]
-    password_selectors = [
-        '#passwordInput',
-        'input[name="Password"]',
-    ]
-
-    user_selector = None
-    for candidate in selectors:
-        try:
-            await page.wait_for_selector(candidate, timeout=2000)
-            user_selector = candidate
-            break
-        except PWTimeout:
-            continue
+    # CSS selector lists: a single wait covers every candidate, instead of
+    # a full timeout per candidate that is absent
+    user_selector = '#userNameInput, input[name="UserName"]'
+    password_selector = '#passwordInput, input[name="Password"]'
 
-    if not user_selector:
+    try:
+        await page.wait_for_selector(user_selector, timeout=2000)
+    except PWTimeout:
         return False
 
     logger.info("Detected NWU ADFS login flow; attempting automated authentication.")
 
-    password_selector = None
-    for candidate in password_selectors:
-        try:
-            await page.wait_for_selector(candidate, timeout=2000)
-            password_selector = candidate
-            break
-        except PWTimeout:
-            continue
-
-    if not password_selector:
+    try:
+        await page.wait_for_selector(password_selector, timeout=2000)
+    except PWTimeout:
         logger.warning("NWU ADFS login detected but password field not found; falling back to manual flow.")
         return False
 
@@ -530,6 +621,19 @@ async def _wait_for_outlook_ready(page: Any) -> None:
     await page.wait_for_selector('[role="navigation"], [aria-label="Mail"]', timeout=60000)
 
 
+# Resource types a scripted sign-in never needs. Stylesheets stay: login pages
+# hide inactive panels with CSS and the flow waits on element visibility.
+_LOGIN_BLOCKED_RESOURCES = frozenset({"image", "font", "media"})
+
+
+async def _skip_login_assets(route: Any) -> None:
+    """Route handler for automated-login contexts: drop images, fonts and media."""
+    if route.request.resource_type in _LOGIN_BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 async def _automated_login(service: Optional[str], identity: Optional[str], state_path: Optional[Path]) -> bool:
     """Attempt a fully headless login when credentials are configured."""
 
@@ -552,6 +656,7 @@ async def _automated_login(service: Optional[str], identity: Optional[str], stat
     page = None
     try:
         await apply_stealth(login_context)
+        await login_context.route("**/*", _skip_login_assets)
         page = await login_context.new_page()
         await page.goto(url, wait_until="load", timeout=60000)
 
@@ -614,7 +719,7 @@ async def _automated_login(service: Optional[str], identity: Optional[str], stat
             return False
 
         state_path.parent.mkdir(parents=True, exist_ok=True)
-        await login_context.storage_state(path=str(state_path))
+        await _save_storage_state(login_context, state_path)
         logger.info("Captured %s storage state automatically (headless).", service)
         return True
     except Exception as exc:
@@ -653,30 +758,34 @@ async def _prompt_manual_login(context: Any, service: str, state_path: Path, ide
     )
 
     selectors = SERVICE_LOGIN_READY.get(service, ["[role='main']", "body.authenticated"])
-    deadline = time.time() + MANUAL_LOGIN_TIMEOUT
-    last_ping = 0.0
-
-    while time.time() < deadline:
-        for selector in selectors:
-            try:
-                await page.wait_for_selector(selector, timeout=2000)
-            except PWTimeout:
-                continue
-            else:
-                state_path.parent.mkdir(parents=True, exist_ok=True)
-                await context.storage_state(path=str(state_path))
-                logger.info("Detected %s workspace; saved storage state to %s", service, state_path)
-                try:
-                    await page.close()
-                except Exception:
-                    pass
-                return
 
-        if time.time() - last_ping > 30:
+    # One locator over every ready-selector: it resolves as soon as any of
+    # them appears, and a 30s wait timeout drives the progress log.
+    ready = asyncio.ensure_future(
+        _any_selector(page, selectors).wait_for(timeout=MANUAL_LOGIN_TIMEOUT * 1000)
+    )
+    try:
+        while not (await asyncio.wait({ready}, timeout=30))[0]:
             logger.info("Waiting for %s login to complete...", service)
-            last_ping = time.time()
+    finally:
+        if not ready.done():
+            ready.cancel()
+            await asyncio.gather(ready, return_exceptions=True)
 
-        await page.wait_for_timeout(1000)
+    failure = ready.exception()
+    if failure is not None and not isinstance(failure, PWTimeout):
+        raise failure
+    detected = failure is None
+
+    if detected:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        await _save_storage_state(context, state_path)
+        logger.info("Detected %s workspace; saved storage state to %s", service, state_path)
+        try:
+            await page.close()
+        except Exception:
+            pass
+        return
 
     try:
         await page.close()
@@ -713,14 +822,12 @@ async def _ensure_storage_state(service: Optional[str], state_path: Optional[Pat
             "Provide a pre-authenticated storage_state file or set VAMP_ALLOW_INTERACTIVE_LOGIN=1 to capture it interactively."
         )
 
-    # Ensure Playwright is running so we can spawn a temporary visible browser.
     await ensure_browser()
 
+    # Browsers are reused across logins; only the login context is thrown away.
     try:
-        login_browser = await _PLAYWRIGHT.chromium.launch(
-            headless=False,
-            args=BROWSER_CONFIG.get("args", []),
-        )
+        login_browser = await _interactive_browser()
+        login_context = await login_browser.new_context(**_base_context_kwargs())
     except Exception as exc:
         raise RuntimeError(
             f"Storage state for {service} not found at {state_path} and a visible Chromium session could not be started ({exc}). "
@@ -728,8 +835,6 @@ async def _ensure_storage_state(service: Optional[str], state_path: Optional[Pat
             "with Playwright before retrying."
         ) from exc
 
-    login_context = await login_browser.new_context(**_base_context_kwargs())
-
     try:
         await apply_stealth(login_context)
         await _prompt_manual_login(login_context, service, state_path, identity)
@@ -738,10 +843,6 @@ async def _ensure_storage_state(service: Optional[str], state_path: Optional[Pat
             await login_context.close()
         except Exception:
             pass
-        try:
-            await login_browser.close()
-        except Exception:
-            pass
 
     if not state_path.exists():
         raise RuntimeError(
@@ -769,18 +870,33 @@ async def refresh_storage_state(service: str, identity: Optional[str] = None) ->
 
 
 def refresh_storage_state_sync(service: str, identity: Optional[str] = None) -> Path:
-    """Synchronous convenience wrapper around :func:`refresh_storage_state`."""
+    """Synchronous convenience wrapper around :func:`refresh_storage_state`.
+
+    Every call runs on the same private event loop. The Playwright browser
+    started by the first call belongs to that loop, so later calls reuse it
+    instead of inheriting a browser tied to a loop that has been closed.
+    """
 
-    loop = asyncio.new_event_loop()
+    global _SYNC_LOOP
+    if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+        _SYNC_LOOP = asyncio.new_event_loop()
+        atexit.register(_close_sync_loop, _SYNC_LOOP)
     try:
-        asyncio.set_event_loop(loop)
-        return loop.run_until_complete(refresh_storage_state(service, identity))
+        asyncio.set_event_loop(_SYNC_LOOP)
+        return _SYNC_LOOP.run_until_complete(refresh_storage_state(service, identity))
     finally:
-        try:
-            loop.run_until_complete(loop.shutdown_asyncgens())
-        except Exception:
-            pass
         asyncio.set_event_loop(None)
+
+
+def _close_sync_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Shut down the browsers owned by ``loop`` at interpreter exit."""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(shutdown_browser())
+    except Exception:
+        pass
+    finally:
         loop.close()
 
 # --------------------------------------------------------------------------------------
@@ -793,6 +909,23 @@ async def _maybe_await(result: Any) -> None:
         await result
 
 
+def _prefill_item_fields(item: Dict[str, Any]) -> None:
+    """Fill the title/source/path/date aliases the scorer reads."""
+
+    title = item.get("title") or item.get("path") or ""
+    platform = item.get("platform") or item.get("source") or ""
+    timestamp = item.get("timestamp") or item.get("date") or item.get("modified") or ""
+
+    item.setdefault("title", title)
+    item.setdefault("source", platform or item.get("source") or "")
+    item.setdefault("platform", platform)
+    item.setdefault("path", item.get("path") or title)
+    item.setdefault("relpath", item.get("relpath") or item.get("path") or title)
+    if timestamp:
+        item.setdefault("date", timestamp)
+        item.setdefault("modified", timestamp)
+
+
 async def _score_and_batch(
     items: List[Dict[str, Any]],
     sink: Callable[[List[Dict[str, Any]]], Any],
@@ -805,50 +938,59 @@ async def _score_and_batch(
         return
 
     total = len(items)
-    pending: List[Dict[str, Any]] = []
-
-    for idx, item in enumerate(items, start=1):
-        title = item.get("title") or item.get("path") or ""
-        platform = item.get("platform") or item.get("source") or ""
-        timestamp = item.get("timestamp") or item.get("date") or item.get("modified") or ""
-
-        item.setdefault("title", title)
-        item.setdefault("source", platform or item.get("source") or "")
-        item.setdefault("platform", platform)
-        item.setdefault("path", item.get("path") or title)
-        item.setdefault("relpath", item.get("relpath") or item.get("path") or title)
-        if timestamp:
-            item.setdefault("date", timestamp)
-            item.setdefault("modified", timestamp)
-
+    compute_batch = getattr(SCORER, "compute_batch", None)
+    slices = [items[start:start + batch_size] for start in range(0, total, batch_size)]
+
+    async def _score_slice(chunk: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        # One scorer call per slice, run in a worker thread so the event loop
+        # keeps serving Playwright pages meanwhile. None means "score item by
+        # item", so only the items that actually fail end up unscored.
+        if compute_batch is None:
+            return None
+        for item in chunk:
+            _prefill_item_fields(item)
         try:
-            scored = SCORER.compute(item)
-            item.update(scored)
-            item["_scored"] = True
-        except Exception as exc:
-            logger.warning(f"Scoring failed for item {title or '[unnamed]'}: {exc}")
-            item.setdefault("_scored", False)
-            item.setdefault("score", 0.0)
-            item.setdefault("band", "Unscored")
-            item.setdefault("rationale", "Scoring not available")
-
-        _normalize_evidence(item)
-
-        pending.append(item)
-
-        if len(pending) >= batch_size:
-            try:
-                await _maybe_await(sink(list(pending)))
-            finally:
-                pending.clear()
+            return await asyncio.to_thread(compute_batch, chunk)
+        except Exception:
+            return None
 
-        if on_progress:
-            progress = 40 + (50 * (idx / total))
-            capped = min(90, progress)
-            await on_progress(capped, f"Scoring items ({idx}/{total})")
+    # Slice n+1 is scored in the background while slice n is merged, reported
+    # and flushed; at most two slices are in flight and sink order is kept.
+    upcoming = asyncio.ensure_future(_score_slice(slices[0]))
+    idx = 0
+    try:
+        for n, chunk in enumerate(slices):
+            scored_list = await upcoming
+            if n + 1 < len(slices):
+                upcoming = asyncio.ensure_future(_score_slice(slices[n + 1]))
 
-    if pending:
-        await _maybe_await(sink(list(pending)))
+            for pos, item in enumerate(chunk):
+                try:
+                    if scored_list is not None:
+                        scored = scored_list[pos]
+                    else:
+                        _prefill_item_fields(item)
+                        scored = SCORER.compute(item)
+                    item.update(scored)
+                    item["_scored"] = True
+                except Exception as exc:
+                    logger.warning(f"Scoring failed for item {item.get('title') or item.get('path') or '[unnamed]'}: {exc}")
+                    item.setdefault("_scored", False)
+                    item.setdefault("score", 0.0)
+                    item.setdefault("band", "Unscored")
+                    item.setdefault("rationale", "Scoring not available")
+
+                _normalize_evidence(item)
+
+                idx += 1
+                if on_progress:
+                    progress = 40 + (50 * (idx / total))
+                    capped = min(90, progress)
+                    await on_progress(capped, f"Scoring items ({idx}/{total})")
+
+            await _maybe_await(sink(list(chunk)))
+    finally:
+        upcoming.cancel()
 
     if on_progress:
         await on_progress(90, "Scoring complete")
@@ -858,21 +1000,30 @@ def _normalize_evidence(item: Dict[str, Any]) -> None:
     """Align evidence items with the canonical schema."""
 
     source = (item.get("source") or "").lower() or "unknown"
-    platform = item.get("platform") or PLATFORM_LABELS.get(source, source.title())
+    platform = item.get("platform") or PLATFORM_LABELS.get(source) or source.title()
 
     item["source"] = source
     item["platform"] = platform
     item["title"] = item.get("title") or item.get("path") or "Untitled item"
 
-    snippet = _clean_text(
+    raw_snippet = (
         item.get("snippet")
         or item.get("body")
         or item.get("preview")
         or item.get("full_text")
         or ""
     )
+    snippet = ""
+    if isinstance(raw_snippet, str) and len(raw_snippet) > _SNIPPET_SCAN_CHARS:
+        # full_text can be a whole attachment; collapsing a prefix gives the
+        # same first 400 characters unless that prefix is mostly whitespace
+        snippet = _clean_text(raw_snippet[:_SNIPPET_SCAN_CHARS])
+        if len(snippet) < _SNIPPET_CHARS:
+            snippet = ""
+    if not snippet:
+        snippet = _clean_text(raw_snippet)
     if snippet:
-        item["snippet"] = snippet[:400]
+        item["snippet"] = snippet[:_SNIPPET_CHARS]
 
     timestamp = item.get("date") or item.get("timestamp") or item.get("modified") or ""
     if timestamp:
@@ -939,10 +1090,15 @@ def _expand_attachment_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]
         expanded.extend(_build_attachment_items(item))
     return expanded
 
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _clean_text(value: Optional[str]) -> str:
     if not value:
         return ""
-    return re.sub(r"\s+", " ", str(value)).strip()
+    text = value if isinstance(value, str) else str(value)
+    return _WHITESPACE_RE.sub(" ", text).strip()
 
 
 async def _soft_scroll(page: Any, times: int = 5, delay: int = 500) -> None:
@@ -985,26 +1141,59 @@ async def _query_with_fallbacks(node: Any, selectors: List[str], attribute: Opti
 def _now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
 
+_ABSOLUTE_TS_CACHE_MAX = 4096
+# Timestamp label -> parsed datetime, or None when it is not an absolute
+# date (relative labels such as "Yesterday 3:15 PM" are resolved per call)
+_absolute_ts_cache: Dict[str, Optional[dt.datetime]] = {}
+
+
+def _parse_absolute_ts(value: str) -> Optional[dt.datetime]:
+    try:
+        return _absolute_ts_cache[value]
+    except KeyError:
+        pass
+
+    # Each format is only tried when the label has the characters it needs
+    # (all of them start with a digit), so "Yesterday 3:15 PM" and friends
+    # go straight to the RFC 2822 fallback instead of raising four times.
+    # strptime matches literals case-insensitively, hence upper().
+    parsed: Optional[dt.datetime] = None
+    if value[0].isdigit():
+        upper = value.upper()
+        has_time = ":" in value
+        for applies, parser in (
+            (True, dt.datetime.fromisoformat),
+            (has_time and upper.endswith("Z") and "T" in upper,
+             lambda s: dt.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ")),
+            (has_time and "-" in value, lambda s: dt.datetime.strptime(s, "%Y-%m-%d %H:%M:%S")),
+            (has_time and "/" in value, lambda s: dt.datetime.strptime(s, "%m/%d/%Y %H:%M %p")),
+        ):
+            if not applies:
+                continue
+            try:
+                parsed = parser(value)
+                break
+            except Exception:
+                continue
+    if parsed is None:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except Exception:
+            parsed = None
+
+    # Mailbox and drive listings repeat the same labels row after row
+    if len(_absolute_ts_cache) >= _ABSOLUTE_TS_CACHE_MAX:
+        _absolute_ts_cache.clear()
+    _absolute_ts_cache[value] = parsed
+    return parsed
+
+
 def _parse_ts(ts_str: str) -> Optional[dt.datetime]:
     value = (ts_str or "").strip()
     if not value:
         return None
 
-    for parser in (
-        lambda s: dt.datetime.fromisoformat(s),
-        lambda s: dt.datetime.strptime(s, "%Y-%m-%dT%H:%M:%SZ"),
-        lambda s: dt.datetime.strptime(s, "%Y-%m-%d %H:%M:%S"),
-        lambda s: dt.datetime.strptime(s, "%m/%d/%Y %H:%M %p"),
-    ):
-        try:
-            return parser(value)
-        except Exception:
-            continue
-
-    try:
-        parsed = parsedate_to_datetime(value)
-    except Exception:
-        parsed = None
+    parsed = _parse_absolute_ts(value)
     if parsed:
         return parsed
 
@@ -1073,19 +1262,27 @@ def _in_month(ts: Optional[dt.datetime], month_bounds: Optional[object]) -> bool
 
     return start <= ts.date() < end  # type: ignore[operator]
 
+_HASH_CACHE_MAX = 8192
+# Scrapers re-read the same rows across retry attempts and attachment
+# expansion, so the same triple is hashed many times per scan
+_hash_cache: Dict[Tuple[str, str, str], str] = {}
+
+
 def _hash_from(source: str, path: str, timestamp: str = "") -> str:
     """Deterministic hash for dedup."""
-    h = hashlib.sha1()
-    h.update(source.encode("utf-8"))
-    h.update(b"|")
-    h.update(path.encode("utf-8"))
-    h.update(b"|")
-    h.update(timestamp.encode("utf-8"))
-    return h.hexdigest()
+    key = (source, path, timestamp)
+    digest = _hash_cache.get(key)
+    if digest is None:
+        # Same bytes as hashing source, "|", path, "|", timestamp in turn
+        digest = hashlib.sha1(f"{source}|{path}|{timestamp}".encode("utf-8")).hexdigest()
+        if len(_hash_cache) >= _HASH_CACHE_MAX:
+            _hash_cache.clear()
+        _hash_cache[key] = digest
+    return digest
 
 async def _ocr_element_text(element: Any) -> str:
     """Attempt OCR-based text extraction from an element screenshot."""
-    if not OCR_AVAILABLE or element is None:
+    if element is None or not _ocr_available():
         return ""
 
     try:
@@ -1219,6 +1416,63 @@ async def _gather_outlook_attachments(page: Any, download_dir: Optional[Path] =
     return attachments
 
 
+# Everything scrape_outlook reads from the message rows, in one browser round
+# trip for the whole list: each row's own attributes/text plus, per field, the
+# innerText of the first candidate selector with any text. Selectors native
+# querySelector rejects (Playwright-only engines) are found once and returned
+# as ``unsupported`` so only those go through _query_with_fallbacks.
+_OUTLOOK_ROWS_META_JS = """
+([rows, fieldSelectors]) => {
+    const probe = document.createDocumentFragment();
+    const usable = {};
+    const unsupported = {};
+    for (const [field, selectors] of Object.entries(fieldSelectors)) {
+        usable[field] = [];
+        unsupported[field] = [];
+        for (const sel of selectors) {
+            try {
+                probe.querySelector(sel);
+                usable[field].push(sel);
+            } catch (e) {
+                unsupported[field].push(sel);
+            }
+        }
+    }
+    const read = (node) => {
+        const attr = (name) => node.getAttribute(name) || "";
+        const fields = {};
+        for (const [field, selectors] of Object.entries(usable)) {
+            for (const sel of selectors) {
+                const el = node.querySelector(sel);
+                const text = el ? el.innerText || "" : "";
+                if (text.trim()) {
+                    fields[field] = text;
+                    break;
+                }
+            }
+        }
+        return {
+            aria: attr('aria-label'),
+            convoId: attr('data-convid') || attr('data-conversation-id') || attr('data-conversationid') || attr('data-unique-id'),
+            nodeText: node.innerText || "",
+            timestampAttr: attr('data-converteddatetime') || attr('data-timestamp'),
+            fields,
+        };
+    };
+    return {rows: rows.map(read), unsupported};
+}
+"""
+
+
+def _outlook_row_fields() -> Dict[str, List[str]]:
+    return {
+        "subject": list(OUTLOOK_SELECTORS.message_subject),
+        "sender": list(OUTLOOK_SELECTORS.message_sender),
+        "preview": list(OUTLOOK_SELECTORS.message_preview),
+        "date": list(OUTLOOK_SELECTORS.message_date),
+    }
+
+
 async def scrape_outlook(
     page: Any,
     month_bounds: Optional[object] = None,
@@ -1240,12 +1494,12 @@ async def scrape_outlook(
 
     try:
         await page.wait_for_load_state("networkidle")
-        for inbox_selector in OUTLOOK_SELECTORS.inbox_list:
-            try:
-                await page.wait_for_selector(inbox_selector, timeout=12000)
-                break
-            except Exception:
-                continue
+        try:
+            await _any_selector(page, OUTLOOK_SELECTORS.inbox_list).wait_for(
+                timeout=12000 * len(OUTLOOK_SELECTORS.inbox_list)
+            )
+        except Exception:
+            pass
         await page.wait_for_selector('[role="listitem"], [role="option"]', timeout=20000)
     except Exception:
         logger.warning(
@@ -1303,6 +1557,17 @@ async def scrape_outlook(
         logger.debug("Outlook fallback selector matched %d nodes", len(rows))
 
     total_rows = len(rows) or 1
+    row_fields = _outlook_row_fields()
+
+    row_metas: List[Dict[str, Any]] = []
+    # Selectors the batch read could not apply; read per row through Playwright
+    playwright_fields: Dict[str, List[str]] = row_fields
+    try:
+        batch = await page.evaluate(_OUTLOOK_ROWS_META_JS, [rows, row_fields])
+        row_metas = batch.get("rows") or []
+        playwright_fields = batch.get("unsupported") or {}
+    except Exception as exc:
+        logger.debug("Outlook row metadata evaluation failed: %s", exc)
 
     for idx, row in enumerate(rows):
         if len(items) >= OUTLOOK_MAX_ROWS:
@@ -1316,31 +1581,23 @@ async def scrape_outlook(
             except Exception:
                 pass
 
-        meta: Dict[str, Any] = {}
-        subject = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_subject)
-        sender = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_sender)
-        preview = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_preview)
-        ts_text = await _query_with_fallbacks(row, OUTLOOK_SELECTORS.message_date)
-        aria_label = ""
-        convo_id = ""
-        node_text = ""
+        meta: Dict[str, Any] = row_metas[idx] if idx < len(row_metas) else {}
 
-        try:
-            meta = await row.evaluate(
-                """
-                (node) => {
-                    const attr = (name) => node.getAttribute(name) || "";
-                    return {
-                        aria: attr('aria-label'),
-                        convoId: attr('data-convid') || attr('data-conversation-id') || attr('data-conversationid') || attr('data-unique-id'),
-                        nodeText: node.innerText || "",
-                        timestampAttr: attr('data-converteddatetime') || attr('data-timestamp')
-                    };
-                }
-                """
-            )
-        except Exception as exc:
-            logger.debug("Outlook row metadata evaluation failed: %s", exc)
+        # Fields come from the batch read above; the per-selector Playwright
+        # path only runs for selectors it could not apply (usually none)
+        fields = meta.get("fields") or {}
+        subject = _clean_text(fields.get("subject")) or await _query_with_fallbacks(
+            row, playwright_fields.get("subject", [])
+        )
+        sender = _clean_text(fields.get("sender")) or await _query_with_fallbacks(
+            row, playwright_fields.get("sender", [])
+        )
+        preview = _clean_text(fields.get("preview")) or await _query_with_fallbacks(
+            row, playwright_fields.get("preview", [])
+        )
+        ts_text = _clean_text(fields.get("date")) or await _query_with_fallbacks(
+            row, playwright_fields.get("date", [])
+        )
 
         aria_label = _clean_text(meta.get("aria")) if meta else ""
         convo_id = _clean_text(meta.get("convoId")) if meta else ""
@@ -1533,8 +1790,10 @@ async def scrape_outlook(
         items.append(item)
 
     if download_dir and download_dir.exists():
+        # A deep-read scan can leave hundreds of downloaded attachments;
+        # unlink them in a worker thread instead of on the event loop
         try:
-            shutil.rmtree(download_dir, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, download_dir, ignore_errors=True)
         except Exception:
             pass
 
@@ -1544,12 +1803,10 @@ async def scrape_onedrive(page: Any, month_bounds: Optional[object] = None) -> L
     """OneDrive scraper with deep read and month filtering."""
     items: List[Dict[str, Any]] = []
 
-    for grid_selector in ONEDRIVE_SELECTORS.grid:
-        try:
-            await page.wait_for_selector(grid_selector, timeout=12000)
-            break
-        except Exception:
-            continue
+    try:
+        await _any_selector(page, ONEDRIVE_SELECTORS.grid).wait_for(timeout=12000 * len(ONEDRIVE_SELECTORS.grid))
+    except Exception:
+        pass
 
     await _soft_scroll(page, times=15)
 
@@ -1637,7 +1894,7 @@ async def scrape_efundi(page: Any, month_bounds: Optional[object] = None) -> Lis
             except Exception:
                 raw_text = ""
             txt = _clean_text(raw_text)
-            if (not txt or len(txt) < 5) and OCR_AVAILABLE:
+            if (not txt or len(txt) < 5) and _ocr_available():
                 txt = await _ocr_element_text(el)
             if not txt or len(txt) < 5:
                 continue
@@ -1789,7 +2046,18 @@ def _log_ocr_status_once() -> None:
             logger.info("OCR fallback disabled: dependencies not installed")
 
 
-_log_ocr_status_once()
+def _ocr_available() -> bool:
+    """Whether OCR can run; the tesseract subprocess probe runs on first use."""
+    global OCR_AVAILABLE, _OCR_ERROR
+    if OCR_AVAILABLE is None:
+        try:
+            pytesseract.get_tesseract_version()  # type: ignore[union-attr]
+            OCR_AVAILABLE = True
+        except Exception as exc:  # pragma: no cover - environment dependent
+            OCR_AVAILABLE = False
+            _OCR_ERROR = str(exc)
+    _log_ocr_status_once()
+    return OCR_AVAILABLE
 
 # --------------------------------------------------------------------------------------
 # SCAN_ACTIVE Wrapper for WebSocket integration
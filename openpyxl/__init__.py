@@ -128,6 +128,9 @@ class Workbook:
                 return ws
         raise KeyError(key)
 
+    def close(self) -> None:
+        """No-op: the archive is closed as soon as ``load_workbook`` returns."""
+
     def save(self, filename: str | Path) -> None:
         filename = str(filename)
         with ZipFile(filename, "w", ZIP_DEFLATED) as zf:
@@ -143,7 +146,14 @@ class Workbook:
                 zf.writestr(f"xl/worksheets/sheet{idx}.xml", sheet_xml)
 
 
-def load_workbook(filename: str | Path, data_only: bool = True) -> Workbook:
+def load_workbook(
+    filename: str | Path,
+    data_only: bool = True,
+    read_only: bool = False,
+    keep_links: bool = True,
+) -> Workbook:
+    # ``read_only``/``keep_links`` are accepted for API compatibility; this stub
+    # always reads the whole archive up front and never keeps external links.
     wb = Workbook()
     wb.worksheets = []
 
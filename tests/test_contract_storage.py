@@ -0,0 +1,19 @@
+import json
+
+import pytest
+
+from backend.contracts import storage
+from backend.contracts.models import StaffProfile
+
+
+def test_failed_save_keeps_previous_contract(monkeypatch, tmp_path):
+    monkeypatch.setattr(storage, "CONTRACTS_DIR", tmp_path)
+    profile = StaffProfile(staff_id="tester1", name="Tester", position="Lecturer", cycle_year=2025)
+    path = storage.save_contract(profile)
+
+    profile.flags.append(object())
+    with pytest.raises(TypeError):
+        storage.save_contract(profile)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["flags"] == []
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
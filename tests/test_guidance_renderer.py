@@ -0,0 +1,18 @@
+from backend.guidance_renderer import generate_qualitative_guidance
+
+
+def test_short_personal_permission_note_ignores_kpa_name():
+    ctx = {"task": {"title": "Submit quarterly report", "kpa": "KPA5: Community Engagement"}}
+
+    text = generate_qualitative_guidance(ctx, variant="short_personal")["text"]
+
+    assert "goodwill permission" not in text
+    assert "colleague statement" in text
+
+
+def test_short_personal_permission_note_for_outside_stakeholders():
+    ctx = {"task": {"title": "Workshop with a local NGO", "kpa": "KPA2"}}
+
+    text = generate_qualitative_guidance(ctx, variant="short_personal")["text"]
+
+    assert "goodwill permission" in text
@@ -0,0 +1,154 @@
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from backend import nwu_brain_scorer
+from backend.nwu_brain_scorer import brain_score_evidence, load_brain
+
+
+@pytest.fixture(autouse=True)
+def _isolated_score_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(nwu_brain_scorer, "SCORE_CACHE_DIR", tmp_path / "score_cache")
+    monkeypatch.setattr(nwu_brain_scorer, "_SCORE_MEMO", nwu_brain_scorer.OrderedDict())
+
+
+def test_brain_patterns_are_compiled_once():
+    brain = load_brain()
+
+    assert set(brain.kpa_routes) == {"KPA1", "KPA2", "KPA3", "KPA4", "KPA5"}
+    assert all(patterns for patterns in brain.tier_patterns.values())
+    assert load_brain() is brain
+
+
+def test_brain_score_evidence_routes_teaching_artefact():
+    text = "External moderator report on the rubric and item analysis for the module guide."
+
+    result = brain_score_evidence(path=Path("moderation_rubric.pdf"), full_text=text)
+
+    assert result["primary_kpa_code"] == "KPA1"
+    assert result["kpa_route_scores"]["KPA1"] > result["kpa_route_scores"]["KPA3"]
+
+
+def test_brain_score_evidence_detects_policy_and_values():
+    text = "Signed under the Community Engagement Policy; excellence award for outreach."
+
+    result = brain_score_evidence(path=Path("outreach.docx"), full_text=text)
+
+    assert any(hit["title"] == "Community Engagement Policy" for hit in result["policy_hits"])
+    assert "Excellence" in result["values_hits"]
+
+
+def test_brain_score_evidence_reuses_cached_result(tmp_path, monkeypatch):
+    text = "Workshop delivered at a school outreach event."
+    first = brain_score_evidence(path=Path("outreach.pdf"), full_text=text)
+    first["rating"] = -1
+
+    nwu_brain_scorer._SCORE_MEMO.clear()
+    monkeypatch.setattr(nwu_brain_scorer, "_score_evidence", lambda **_: pytest.fail("cache miss"))
+    second = brain_score_evidence(path=Path("outreach.pdf"), full_text=text)
+
+    assert second["rating"] != -1
+    assert second["primary_kpa_code"] == first["primary_kpa_code"]
+    assert any((tmp_path / "score_cache").rglob("*"))
+
+
+def test_required_literals_cover_every_alternative():
+    pattern = re.compile(r"\bpeer (observation|review)\b|teaching portfolio\b", re.IGNORECASE)
+
+    assert nwu_brain_scorer._required_literals(pattern) == ("observation", "review", "teaching portfolio")
+    assert nwu_brain_scorer._required_literals(re.compile(r"\d+|[a-z]")) is None
+
+
+def test_lowered_variant_drops_ignorecase_only_when_safe():
+    twin = nwu_brain_scorer._lowered_variant(re.compile(r"\bSTLES\b|\SX", re.IGNORECASE))
+
+    assert twin.pattern == r"\bstles\b|\Sx"
+    assert not twin.flags & re.IGNORECASE
+    assert nwu_brain_scorer._lowered_variant(re.compile(r"\x41BC", re.IGNORECASE)) is None
+    assert nwu_brain_scorer._lowered_variant(re.compile(r"(?-i:ABC)", re.IGNORECASE)) is None
+
+
+def test_text_views_fall_back_for_unsafe_case_folding():
+    assert nwu_brain_scorer._text_views("Ethics").lowered == "ethics"
+    assert nwu_brain_scorer._text_views("ſtudent").lowered is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "KİT teaching İnnovation ethıcs Ethics policy",
+        "ETHIKA: ınnovatıon in teachıng and İNTEGRITY",
+        "Naïve Ünïcode café teaching portfolio and ſtudent ethics",
+    ],
+)
+def test_prefilters_keep_ignorecase_matches_on_non_ascii_text(monkeypatch, text):
+    prefiltered = nwu_brain_scorer._score_evidence(path=Path("notes.txt"), full_text=text, kpa_hint_code=None)
+
+    brain = load_brain()
+    monkeypatch.setattr(brain, "pattern_literals", {})
+    monkeypatch.setattr(brain, "lowered_patterns", {})
+    monkeypatch.setattr(brain, "policy_automaton", None)
+    plain = nwu_brain_scorer._score_evidence(path=Path("notes.txt"), full_text=text, kpa_hint_code=None)
+
+    assert prefiltered == plain
+
+
+def test_dotted_capital_i_still_routes_by_ignorecase_match():
+    result = brain_score_evidence(path=Path("notes.txt"), full_text="KİT teaching İnnovation ethıcs Ethics policy")
+
+    assert result["primary_kpa_code"] == "KPA3"
+    assert result["values_hits"] == ["Ethics", "Innovation"]
+
+
+def _reference_route_scores(filename, extension, text):
+    brain = load_brain()
+    weights = brain.route_weights
+    fname, ext = filename.lower(), extension.lower().lstrip(".")
+    scores = {}
+    for code, route in brain.kpa_routes.items():
+        score = weights.extension if ext in route.extensions else 0.0
+        score += weights.filename * sum(1 for p in route.filename_cues if p.search(fname))
+        score += weights.content * sum(1 for p in route.content_regex if p.search(text))
+        score += weights.negative * sum(1 for p in route.negative_cues if p.search(text) or p.search(fname))
+        scores[code] = score
+    return scores
+
+
+@pytest.mark.parametrize(
+    "filename, text",
+    [
+        ("moderation_rubric.pdf", "External moderator report on the rubric and item analysis for the module guide."),
+        ("outreach.docx", "Signed under the Community Engagement Policy; excellence award for outreach."),
+        ("notes.txt", "KİT teaching İnnovation ethıcs Ethics policy"),
+    ],
+)
+def test_route_scores_are_reported_in_full_for_every_kpa(filename, text):
+    path = Path(filename)
+    _, scores = nwu_brain_scorer._score_kpa_for_text(path.name, path.suffix, text)
+
+    assert scores == _reference_route_scores(path.name, path.suffix, text)
+
+
+def test_score_cache_key_changes_with_scorer_version(monkeypatch):
+    key = nwu_brain_scorer._score_cache_key("a.pdf", "text", None)
+    monkeypatch.setattr(nwu_brain_scorer, "SCORER_VERSION", nwu_brain_scorer.SCORER_VERSION + "-next")
+
+    assert nwu_brain_scorer._score_cache_key("a.pdf", "text", None) != key
+
+
+def test_score_cache_prune_drops_oldest_entries_first(tmp_path):
+    cache_dir = tmp_path / "score_cache"
+    for age, name in enumerate(["aa/new", "bb/old", "cc/oldest"]):
+        path = cache_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * 10, encoding="utf-8")
+        os.utime(path, (1000 - age, 1000 - age))
+    in_flight = cache_dir / "dd" / "entry.123.tmp"
+    in_flight.parent.mkdir()
+    in_flight.write_text("x" * 10, encoding="utf-8")
+
+    nwu_brain_scorer._prune_score_cache(max_bytes=15)
+
+    assert sorted(p.relative_to(cache_dir).as_posix() for p in cache_dir.glob("*/*")) == ["aa/new", "dd/entry.123.tmp"]
@@ -0,0 +1,41 @@
+import random
+from pathlib import Path
+
+from backend.data.nwu_brain.scoring import NWUScorer
+
+
+MANIFEST_PATH = Path(__file__).resolve().parents[1] / "backend" / "data" / "nwu_brain" / "brain_manifest.json"
+
+
+def test_manifest_scorer_batch_matches_single_and_tier_fallback():
+    scorer = NWUScorer(MANIFEST_PATH)
+    items = [
+        {"title": "report.pdf", "full_text": "Received a TEACHING EXCELLENCE AWARD"},
+        {"title": "notes.docx", "full_text": "ſtudent feedback summary"},
+        {"title": "blank.txt"},
+    ]
+    batch = scorer.compute_batch([dict(item) for item in items])
+    assert batch == [scorer.compute(dict(item)) for item in items]
+    assert batch[0]["tier"] == ["Transformational"]
+
+
+def test_manifest_scorer_batch_tiers_match_per_item_tiers():
+    scorer = NWUScorer(MANIFEST_PATH)
+    rng = random.Random(7)
+    words = [lit for _, literals, _ in scorer._tier_literals for lit in literals[:15]]
+    words += ["notes", "minutes", "Dean’s medal", "Principal Investigator (PI)", "ſeminar delivered"]
+    items = [
+        # A keyword cut in half across two items must not match either one
+        {"title": "national recog"},
+        {"title": "nition received"},
+    ]
+    for n in range(200):
+        text = " ".join(rng.choice(words).upper() if rng.random() < 0.3 else rng.choice(words)
+                        for _ in range(rng.randint(0, 4)))
+        items.append({"title": f"item{n}.pdf", "full_text": text})
+
+    batch = scorer.compute_batch([dict(item) for item in items])
+
+    assert [s["tier"] for s in batch] == [scorer.compute(dict(item))["tier"] for item in items]
+    assert batch[0]["tier"] == batch[1]["tier"] == []
+    assert len({tuple(s["tier"]) for s in batch}) == 4
@@ -0,0 +1,128 @@
+import json
+import time
+
+import pytest
+
+from backend.llm.ollama_client import LLMJsonError, _first_balanced_object, extract_json_object
+
+
+def test_first_balanced_object_ignores_braces_in_strings():
+    text = 'Sure! {"note": "use } carefully", "nested": {"a": 1}} and then {"b": 2}'
+
+    assert _first_balanced_object(text) == '{"note": "use } carefully", "nested": {"a": 1}}'
+
+
+def test_first_balanced_object_handles_escaped_quotes_and_backslashes():
+    text = r'{"path": "C:\\", "quote": "say \"}\""} trailing }'
+
+    assert _first_balanced_object(text) == r'{"path": "C:\\", "quote": "say \"}\""}'
+
+
+def test_first_balanced_object_returns_none_without_object():
+    assert _first_balanced_object("no json here }") is None
+
+
+def test_extract_json_object_picks_first_object_from_chatter():
+    raw = 'Here is the plan:\n{"kpas": [{"code": "KPA1"}]}\nLet me know {if} you need more.'
+
+    assert extract_json_object(raw) == {"kpas": [{"code": "KPA1"}]}
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def iter_content(self, chunk_size=None):
+        return iter(self._chunks)
+
+
+def test_read_streamed_response_concatenates_chunks():
+    from backend.llm.ollama_client import _read_streamed_response
+
+    stream = _FakeStream([
+        b'{"response": " {\\"a\\"", "done": false}\n',
+        b"\n",
+        b'{"response": ": 1} ", "done": true}\n',
+        b'{"response": "ignored"}\n',
+    ])
+
+    assert _read_streamed_response(stream) == '{"a": 1}'
+
+
+def test_read_streamed_response_handles_records_split_across_chunks():
+    from backend.llm.ollama_client import _read_streamed_response
+
+    body = (
+        '{"response": "caf\u00e9 ", "done": false}\n'
+        '{"response": "cr\u00e8me", "done": true}\n'
+    ).encode("utf-8")
+    # Three-byte chunks cut records and the two-byte UTF-8 characters apart.
+    stream = _FakeStream([body[i : i + 3] for i in range(0, len(body), 3)])
+
+    assert _read_streamed_response(stream) == "caf\u00e9 cr\u00e8me"
+
+
+def test_read_streamed_response_stops_when_object_closes():
+    from backend.llm.ollama_client import _read_streamed_response
+
+    records = [
+        {"response": '{"a": "}\\', "done": False},
+        {"response": '"", "b": {}', "done": False},
+        {"response": "} ", "done": False},
+        {"response": "never read", "done": False},
+    ]
+    stream = _FakeStream([json.dumps(r).encode() + b"\n" for r in records])
+
+    assert _read_streamed_response(stream, stop_at_object_end=True) == '{"a": "}\\"", "b": {}}'
+
+
+def test_read_streamed_response_rejects_truncated_stream():
+    from backend.llm.ollama_client import _read_streamed_response
+
+    with pytest.raises(json.JSONDecodeError):
+        _read_streamed_response(_FakeStream([b'{"response": "x", "done": false}\n{"resp']))
+
+
+def test_extract_json_object_repairs_offline_before_asking_llm(monkeypatch):
+    from backend.llm import ollama_client
+
+    def _no_llm(*_args, **_kwargs):  # pragma: no cover - should not be called
+        raise AssertionError("offline repair should have succeeded")
+
+    monkeypatch.setattr(ollama_client, "query_ollama", _no_llm)
+    monkeypatch.setattr(ollama_client, "JSON_REPAIR_STATS", ollama_client.Counter())
+
+    fenced = '```json\n{"note": "line one\nline two", "done": True, "extra": None,}\n```'
+    truncated = 'Result: {"kpas": [{"code": "KPA1", "hours": 12'
+
+    assert extract_json_object(fenced) == {"note": "line one\nline two", "done": True, "extra": None}
+    assert extract_json_object(truncated) == {"kpas": [{"code": "KPA1", "hours": 12}]}
+    assert ollama_client.JSON_REPAIR_STATS["llm"] == 0
+    assert ollama_client.JSON_REPAIR_STATS["repaired"] == 2
+
+
+def test_extract_json_object_raises_when_nothing_recoverable(monkeypatch):
+    from backend.llm import ollama_client
+
+    monkeypatch.setattr(ollama_client, "query_ollama", lambda *_args, **_kwargs: "still not json")
+
+    with pytest.raises(LLMJsonError):
+        extract_json_object("I could not produce a plan.")
+    with pytest.raises(LLMJsonError):
+        extract_json_object("")
+
+
+def test_host_discovery_prefers_list_order_over_first_answer(monkeypatch, tmp_path):
+    from backend.llm import ollama_client
+
+    def _probe(host):
+        # The preferred host answers last; the loopback host answers at once
+        time.sleep(0.2 if "host.docker.internal" in host else 0.0)
+        return "host.docker.internal" in host or "127.0.0.1" in host
+
+    monkeypatch.delenv("OLLAMA_HOST", raising=False)
+    monkeypatch.setattr(ollama_client, "_SESSION", object())
+    monkeypatch.setattr(ollama_client, "HOST_CACHE_PATH", tmp_path / "ollama_host")
+    monkeypatch.setattr(ollama_client, "_probe_host", _probe)
+
+    assert ollama_client._get_ollama_host() == "http://host.docker.internal:11434"
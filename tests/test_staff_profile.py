@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from backend import staff_profile
+from backend.staff_profile import KPA, KPI, StaffProfile
+
+
+def _profile():
+    return StaffProfile(
+        staff_id="tester1",
+        name="Test User",
+        position="Lecturer",
+        cycle_year=2024,
+        kpas=[
+            KPA(
+                code="KPA1",
+                name="Teaching and Learning",
+                weight=40.0,
+                kpis=[KPI(kpi_id="k1", description="Teach ABC123", evidence_types=["slides"])],
+                ta_context={"teaching": ["Teach ABC123"]},
+            )
+        ],
+        flags=["ta_imported"],
+    )
+
+
+def test_to_dict_round_trips_through_from_dict():
+    profile = _profile()
+
+    data = json.loads(json.dumps(profile.to_dict()))
+
+    assert StaffProfile.from_dict(data) == profile
+
+
+def test_save_writes_int_keyed_context(monkeypatch, tmp_path):
+    monkeypatch.setattr(staff_profile, "CONTRACT_DIR", tmp_path)
+    profile = _profile()
+    profile.kpas[0].ta_context["ta_parse_report"] = {2: {"rows": 3}}
+
+    profile.save()
+
+    data = json.loads(profile.contract_path.read_text(encoding="utf-8"))
+    assert data["kpas"][0]["ta_context"]["ta_parse_report"] == {"2": {"rows": 3}}
+    assert data["flags"] == ["ta_imported"]
+
+
+def test_failed_save_keeps_previous_contract(monkeypatch, tmp_path):
+    monkeypatch.setattr(staff_profile, "CONTRACT_DIR", tmp_path)
+    profile = _profile()
+    profile.save()
+
+    profile.flags.append(object())
+    with pytest.raises(TypeError):
+        profile.save()
+
+    assert json.loads(profile.contract_path.read_text(encoding="utf-8"))["flags"] == ["ta_imported"]
+    assert [p.name for p in tmp_path.iterdir()] == [profile.contract_path.name]
@@ -0,0 +1,170 @@
+import json
+import zipfile
+
+from openpyxl import Workbook
+
+from backend.nwu_formats import ta_parser, xlsx_stream
+
+
+def _write_ta(path, rows):
+    wb = Workbook()
+    wb.active.title = "Task Agreement"
+    for row in rows:
+        wb.active.append(row)
+    wb.save(path)
+
+
+def test_grand_total_rows_become_kpas(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_save_snapshot", lambda contract: None)
+    ta_path = tmp_path / "ta.xlsx"
+    _write_ta(
+        ta_path,
+        [
+            ["Task Agreement"],
+            ["Teaching module ABC", None, None, 12, 1],
+            ["Grand Total: Section 1", None, None, 400, 20],
+            ["Grand Total: Section 2", None, None, 700.5, 40],
+            ["Grand Total: Section 3", None, None, 200, 15],
+            ["Grand Total: Section 4", None, None, 250, 15],
+            ["Grand Total: Section 5", None, None, 100, 10],
+        ],
+    )
+
+    contract = ta_parser.parse_nwu_ta(str(ta_path))
+
+    assert set(contract.kpas) == {"KPA1", "KPA2", "KPA3", "KPA4", "KPA5"}
+    assert contract.kpas["KPA2"].hours == 700.5
+    assert contract.kpas["KPA1"].row_number == 3
+    assert contract.snapshot["sheet"] == "Task Agreement"
+    assert contract.total_weight_pct == 100
+
+
+def test_non_numeric_totals_are_reported(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_save_snapshot", lambda contract: None)
+    ta_path = tmp_path / "ta.xlsx"
+    _write_ta(ta_path, [["Grand Total: Section 1", None, None, "n/a", 100]])
+
+    contract = ta_parser.parse_nwu_ta(str(ta_path))
+
+    assert not contract.valid
+    assert "Row 1: non-numeric hours/weight in columns D/E" in contract.validation_errors
+
+
+def test_unreadable_workbook_closes_archive(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_save_snapshot", lambda contract: None)
+    ta_path = tmp_path / "ta.xlsx"
+    with zipfile.ZipFile(ta_path, "w") as zf:
+        zf.writestr("docProps/core.xml", "<x/>")
+    opened = []
+
+    class _TrackingZipFile(zipfile.ZipFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            opened.append(self)
+
+    monkeypatch.setattr(ta_parser.zipfile, "ZipFile", _TrackingZipFile)
+
+    contract = ta_parser.parse_nwu_ta(str(ta_path))
+
+    assert contract.status == "INVALID_TA"
+    assert len(opened) == 1 and opened[0].fp is None
+
+
+def test_staff_and_year_come_from_core_properties(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_save_snapshot", lambda contract: None)
+    ta_path = tmp_path / "ta.xlsx"
+    _write_ta(ta_path, [["Grand Total: Section 1", None, None, 1700, 100]])
+    with zipfile.ZipFile(ta_path, "a") as zf:
+        zf.writestr(
+            "docProps/core.xml",
+            '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties"'
+            ' xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/">'
+            "<dc:creator>12345678</dc:creator>"
+            "<dcterms:created>2025-01-15T15:12:30Z</dcterms:created>"
+            "</cp:coreProperties>",
+        )
+
+    contract = ta_parser.parse_nwu_ta(str(ta_path))
+
+    assert contract.staff_id == "12345678"
+    assert contract.cycle_year == "2025"
+
+
+def test_streamed_shared_strings_match_one_shot_read(monkeypatch, tmp_path):
+    ta_path = tmp_path / "ta.xlsx"
+    _write_ta(ta_path, [["Grand Total: Section 1", None, None, 1700, 100]])
+    with zipfile.ZipFile(ta_path, "a") as zf:
+        zf.writestr(
+            "xl/sharedStrings.xml",
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            "<si><t>Teaching</t></si>"
+            "<si><r><t>Grand </t></r><r><t>Total</t></r></si>"
+            "<si><t/></si>"
+            "</sst>",
+        )
+
+    with zipfile.ZipFile(ta_path) as zf:
+        expected = xlsx_stream.load_shared_strings(zf)
+        monkeypatch.setattr(xlsx_stream, "SHARED_STREAM_MIN_BYTES", 0)
+        streamed = xlsx_stream.load_shared_strings(zf)
+
+    assert expected == ["Teaching", "Grand Total", ""]
+    assert streamed == expected
+
+
+def test_batch_keeps_input_order(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_save_snapshot", lambda contract: None)
+    paths = []
+    for hours in (1700, 850):
+        ta_path = tmp_path / f"ta_{hours}.xlsx"
+        _write_ta(ta_path, [["Grand Total: Section 1", None, None, hours, 100]])
+        paths.append(ta_path)
+
+    contracts = ta_parser.parse_nwu_ta_batch(paths, max_workers=1)
+
+    assert [c.kpas["KPA1"].hours for c in contracts] == [1700, 850]
+
+
+def test_shared_strings_cache_follows_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(xlsx_stream, "_SHARED_CACHE", type(xlsx_stream._SHARED_CACHE)())
+    ta_path = tmp_path / "ta.xlsx"
+
+    def _write(label):
+        _write_ta(ta_path, [["Grand Total: Section 1", None, None, 1700, 100]])
+        with zipfile.ZipFile(ta_path, "a") as zf:
+            zf.writestr(
+                "xl/sharedStrings.xml",
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f"<si><t>{label}</t></si></sst>",
+            )
+
+    _write("Teaching")
+    with zipfile.ZipFile(ta_path) as zf:
+        first = xlsx_stream.cached_shared_strings(zf)
+    with zipfile.ZipFile(ta_path) as zf:
+        assert xlsx_stream.cached_shared_strings(zf) is first
+
+    _write("Research and innovation")
+    with zipfile.ZipFile(ta_path) as zf:
+        assert xlsx_stream.cached_shared_strings(zf) == ("Research and innovation",)
+
+
+def test_snapshot_is_renamed_into_place(monkeypatch, tmp_path):
+    monkeypatch.setattr(ta_parser, "_SNAPSHOT_DIR", tmp_path)
+    contract = ta_parser.PerformanceContract(
+        staff_id="tester1",
+        cycle_year="2025",
+        kpas={},
+        total_weight_pct=0.0,
+        valid=False,
+        # Beyond 64 bits, so orjson (when installed) hands over to json
+        snapshot={"ta_parse_report": {2: {"rows": 2**70}}},
+    )
+
+    out_path = ta_parser._save_snapshot(contract)
+
+    assert out_path == tmp_path / "tester1_2025_TA.json"
+    assert json.loads(out_path.read_text(encoding="utf-8"))["snapshot"] == {
+        "ta_parse_report": {"2": {"rows": 2**70}}
+    }
+    assert [p.name for p in tmp_path.iterdir()] == ["tester1_2025_TA.json"]
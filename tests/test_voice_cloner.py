@@ -0,0 +1,97 @@
+import io
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("torch")
+
+from backend.llm import voice_cloner  # noqa: E402
+
+RATE = 16000
+
+
+class _Speaker:
+    """Mirrors OpenVoice's BaseSpeakerTTS.tts: returns samples when output_path is None."""
+
+    hps = SimpleNamespace(data=SimpleNamespace(sampling_rate=RATE))
+
+    def tts(self, text, output_path, speaker, language="English", speed=1.0):
+        audio = np.zeros(RATE // 10, dtype=np.float32)
+        if output_path is None:
+            return audio
+        sf.write(output_path, audio, RATE)
+
+
+class _Converter:
+    def __init__(self):
+        self.sources = []
+
+    def convert(self, audio_src_path, src_se, tgt_se, output_path=None, tau=0.3, message="default"):
+        self.sources.append(audio_src_path)
+        audio, rate = sf.read(audio_src_path)
+        sf.write(output_path, audio, rate)
+
+
+class _PathOnlyConverter(_Converter):
+    """An older converter that names its output argument differently."""
+
+    def convert(self, audio_src_path, src_se, tgt_se, out_path, message="default"):
+        super().convert(audio_src_path, src_se, tgt_se, output_path=out_path)
+
+
+def _cloner(tmp_path, converter):
+    cloner = object.__new__(voice_cloner.VoiceCloner)
+    cloner.cache_dir = tmp_path
+    cloner.config = {"voice_name": "test", "last_trained": "t0"}
+    cloner.voice_name = "test"
+    cloner.target_se = object()
+    cloner.device = "cpu"
+    cloner.inference_dtype = None
+    cloner._model_lock = threading.Lock()
+    cloner._in_memory_tts = None
+    cloner.base_speaker = _Speaker()
+    cloner.tone_converter = converter
+    return cloner
+
+
+def test_in_memory_path_used_when_api_matches(tmp_path):
+    converter = _Converter()
+    cloner = _cloner(tmp_path, converter)
+
+    out = cloner.text_to_speech("hello", output_path=tmp_path / "out.wav")
+
+    assert out == tmp_path / "out.wav" and out.stat().st_size > 0
+    assert cloner._in_memory_tts is True
+    assert isinstance(converter.sources[0], io.BytesIO)
+
+
+def test_temp_file_path_used_when_api_differs(tmp_path, capsys):
+    converter = _PathOnlyConverter()
+    cloner = _cloner(tmp_path, converter)
+
+    cloner.text_to_speech("hello", output_path=tmp_path / "a.wav")
+    cloner.text_to_speech("again", output_path=tmp_path / "b.wav")
+
+    assert cloner._in_memory_tts is False
+    assert all(isinstance(src, str) for src in converter.sources)
+    assert not list(tmp_path.glob("tts_*.wav"))
+    assert capsys.readouterr().out.count("lacks the in-memory TTS API") == 1
+
+
+def test_in_memory_failure_falls_back_once(tmp_path, capsys, monkeypatch):
+    converter = _Converter()
+    cloner = _cloner(tmp_path, converter)
+    monkeypatch.setattr(_Speaker, "tts", lambda self, text, output_path, **kw: (
+        None if output_path is None else sf.write(output_path, np.zeros(10, dtype=np.float32), RATE)
+    ))
+
+    first = cloner.text_to_speech("hello", output_path=tmp_path / "a.wav")
+    second = cloner.text_to_speech("again", output_path=tmp_path / "b.wav")
+
+    assert first and second and cloner._in_memory_tts is False
+    assert all(isinstance(src, str) for src in converter.sources)
+    assert capsys.readouterr().out.count("falling back to temp files") == 1
+
@@ -24,8 +24,6 @@ import json
 import re
 import uuid
 
-import openpyxl
-
 from backend.expectation_engine import build_expectations_from_ta
 from backend import progress_tracker
 
@@ -127,10 +125,24 @@ def parse_task_agreement_xlsx(path: str) -> Dict[str, Any]:
         "diagnostics": {...}
       }
     """
-    wb = openpyxl.load_workbook(path, data_only=True)
-    # Prefer the explicit sheet name if present
-    sheet = "Task Agreement Form" if "Task Agreement Form" in wb.sheetnames else wb.sheetnames[0]
-    ws = wb[sheet]
+    # Imported here so enrolment and other non-spreadsheet paths of the
+    # controller never pay openpyxl's import cost
+    import openpyxl
+
+    # read_only streams the sheet instead of building a cell object per cell;
+    # such sheets only iterate forward, so the values are pulled out once.
+    wb = openpyxl.load_workbook(path, data_only=True, read_only=True)
+    try:
+        # Prefer the explicit sheet name if present
+        sheet = "Task Agreement Form" if "Task Agreement Form" in wb.sheetnames else wb.sheetnames[0]
+        # Header scan and the fallback layout never look past column 40
+        rows = list(wb[sheet].iter_rows(max_col=40, values_only=True))
+    finally:
+        wb.close()
+
+    def cell(r: int, c: int) -> Any:
+        row = rows[r - 1]
+        return row[c - 1] if c <= len(row) else None
 
     # Detect header row by finding "NUMBER OF HOURS" and a '%' column
     header_row = None
@@ -140,8 +152,8 @@ def parse_task_agreement_xlsx(path: str) -> Dict[str, Any]:
     col_item = None
 
     # scan first 80 rows for header candidates
-    for r in range(1, min(ws.max_row, 120) + 1):
-        row = [ws.cell(r, c).value for c in range(1, min(ws.max_column, 40) + 1)]
+    for r in range(1, min(len(rows), 120) + 1):
+        row = list(rows[r - 1][:40])
         row_str = [(_s(v).lower()) for v in row]
         if any("number of hours" in s for s in row_str) and any(s in {"%", "percent", "percentage"} or "%" in s for s in row_str):
             header_row = r
@@ -175,11 +187,11 @@ def parse_task_agreement_xlsx(path: str) -> Dict[str, Any]:
     weighted_rows = 0
     considered_rows = 0
 
-    for r in range(header_row + 1, ws.max_row + 1):
-        item = ws.cell(r, col_item).value
-        desc = ws.cell(r, col_desc).value
-        hours = ws.cell(r, col_hours).value
-        pct = ws.cell(r, col_pct).value
+    for r in range(header_row + 1, len(rows) + 1):
+        item = cell(r, col_item)
+        desc = cell(r, col_desc)
+        hours = cell(r, col_hours)
+        pct = cell(r, col_pct)
 
         # detect new section
         sec_id, sec_title = _parse_section_cell(item, desc)
@@ -401,6 +413,8 @@ class VampController:
         ordered = [(k, by_kpa[k]) for k in order if k in by_kpa] + [(k, v) for k, v in by_kpa.items() if k not in order]
 
         # write xlsx
+        import openpyxl
+
         out = self.output_dir / f"PA_{sid}_{y}_final.xlsx"
         wb = openpyxl.Workbook()
         ws = wb.active